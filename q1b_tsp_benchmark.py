@@ -0,0 +1,271 @@
+# ============================================================
+# QUESTION 1(b): Benchmark harness for the TSP annealer
+#
+# Runs simulated_annealing on TSPLIB instances and on seeded
+# synthetic instances under a fixed iteration or time budget and
+# reports, per run:
+# - wall time and iterations per second
+# - best tour length and gap to the known optimum (if available)
+# - peak memory of the run
+# as JSON or CSV, so performance regressions are visible.
+#
+# Usage:
+#   python q1b_tsp_benchmark.py --sizes 100 1000 --iterations 200000
+#   python q1b_tsp_benchmark.py --tsplib berlin52.tsp --time-budget 5 \
+#       --format csv --output results.csv
+#   python q1b_tsp_benchmark.py --move-modes 20000 --iterations 200000
+#
+# Known optima: a TSPLIB "<name>.opt.tour" file next to the instance,
+# or --optimum NAME=LENGTH. For TSPLIB instances the best tour is also
+# scored in the instance's EDGE_WEIGHT_TYPE metric (tour_length), the
+# one published optima use, and the gap is taken on that length.
+# ============================================================
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+import q1b_tsp_sa as tsp
+
+
+# ------------------------------------------------------------
+# INSTANCES
+# ------------------------------------------------------------
+def tsplib_instance(path):
+    """
+    Loads a TSPLIB instance and, if present, its .opt.tour file.
+
+    Returns:
+    (name, cities, optimum or None, EDGE_WEIGHT_TYPE)
+    """
+    cities, header = tsp.load_tsplib(path)
+    name = header.get("NAME", os.path.splitext(os.path.basename(path))[0])
+    metric = header["EDGE_WEIGHT_TYPE"]
+    optimum = None
+    tour_path = os.path.splitext(path)[0] + ".opt.tour"
+    if os.path.exists(tour_path):
+        optimum = tsp.tsplib_tour_length(
+            tsp.load_tsplib_tour(tour_path), cities, metric
+        )
+    return name, cities, optimum, metric
+
+
+def synthetic_instance(n, seed):
+    """Uniform random instance on [0, 1000]², reproducible from seed."""
+    cities = tsp.generate_cities(n, rng=random.Random(seed))
+    return f"uniform-{n}-s{seed}", cities, None, None
+
+
+# ------------------------------------------------------------
+# SINGLE RUN (IN A FRESH PROCESS)
+# ------------------------------------------------------------
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _measure(cities, options, seed, metric):
+    baseline = _peak_rss_kb()
+    started = time.perf_counter()
+    best_distance, history, best_tour = tsp.simulated_annealing(
+        cities, rng=random.Random(seed), return_tour=True, **options
+    )
+    wall_time = time.perf_counter() - started
+    return {
+        "best_distance": best_distance,
+        "tour_length": (best_distance if metric is None else
+                        tsp.tsplib_tour_length(best_tour, cities, metric)),
+        "iterations": history.appended,
+        "wall_time_s": wall_time,
+        "iterations_per_s": history.appended / wall_time if wall_time else 0,
+        "peak_rss_kb": _peak_rss_kb(),
+        "run_rss_kb": _peak_rss_kb() - baseline,
+    }
+
+
+def run_case(name, cities, optimum, options, seed, metric=None):
+    """
+    Runs one annealing job in a fresh worker process, so the peak-RSS
+    figure belongs to this run only, and returns a result record.
+
+    metric: TSPLIB EDGE_WEIGHT_TYPE that tour_length and the gap to the
+    optimum are measured in (None = the annealer's Euclidean length).
+    """
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        result = pool.apply(_measure, (cities, options, seed, metric))
+
+    gap = None
+    if optimum:
+        gap = 100.0 * (result["tour_length"] - optimum) / optimum
+    record = {
+        "instance": name,
+        "n": len(cities),
+        "metric": metric or "euclidean",
+        "seed": seed,
+        "cooling_type": options["cooling_type"],
+        "neighbors": options.get("neighbors"),
+        "max_iterations": options["max_iterations"],
+        "time_budget_s": options.get("time_budget"),
+        "optimum": optimum,
+        "gap_percent": gap,
+    }
+    record.update(result)
+    return record
+
+
+# ------------------------------------------------------------
+# MOVE MODES (LARGE-N REGRESSION CHECK)
+# ------------------------------------------------------------
+def move_mode_benchmark(n=20_000, iterations=200_000, neighbors=8,
+                        seed=0):
+    """
+    Times uniform and candidate-list moves on the same large instance,
+    in this process. Accepted candidate 2-opts re-index every city of
+    the reversed segment, so this is where a slow update path shows
+    up; the candidate lists are built before the clock starts.
+
+    Returns:
+    list of records with mode, wall_time_s, iterations_per_s and
+    best_distance
+    """
+    cities = tsp.generate_cities(n, rng=random.Random(seed))
+    candidates = tsp.build_candidate_lists(cities, neighbors)
+    records = []
+    for mode, lists in (("uniform", None), ("candidates", candidates)):
+        started = time.perf_counter()
+        best_distance, _ = tsp.simulated_annealing(
+            cities, "exponential", alpha=0.99997,
+            max_iterations=iterations, neighbors=lists,
+            rng=random.Random(seed), history_capacity=1024,
+        )
+        wall_time = time.perf_counter() - started
+        records.append({
+            "mode": mode,
+            "n": n,
+            "iterations": iterations,
+            "wall_time_s": wall_time,
+            "iterations_per_s": iterations / wall_time,
+            "best_distance": best_distance,
+        })
+    return records
+
+
+# ------------------------------------------------------------
+# OUTPUT
+# ------------------------------------------------------------
+def write_records(records, fmt, out):
+    if fmt == "json":
+        json.dump(records, out, indent=2)
+        out.write("\n")
+        return
+    if not records:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+
+
+# ------------------------------------------------------------
+# COMMAND LINE
+# ------------------------------------------------------------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time-to-quality benchmark for the TSP annealer."
+    )
+    parser.add_argument("--tsplib", nargs="*", default=[],
+                        help="TSPLIB .tsp instance files")
+    parser.add_argument("--sizes", nargs="*", type=int, default=[],
+                        help="sizes of seeded synthetic instances")
+    parser.add_argument("--seeds", nargs="*", type=int, default=[0],
+                        help="run seeds (also used for synthetic "
+                             "instances)")
+    parser.add_argument("--cooling", nargs="*",
+                        default=["exponential", "linear"],
+                        choices=["exponential", "linear"])
+    parser.add_argument("--iterations", type=int, default=100_000,
+                        help="iteration budget per run")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="wall-time budget per run in seconds")
+    parser.add_argument("--T-initial", type=float, default=800)
+    parser.add_argument("--alpha", type=float, default=0.9999)
+    parser.add_argument("--beta", type=float, default=0.01)
+    parser.add_argument("--neighbors", type=int, default=None,
+                        help="k-nearest candidate moves")
+    parser.add_argument("--history-capacity", type=int, default=1024)
+    parser.add_argument("--optimum", nargs="*", default=[],
+                        metavar="NAME=LENGTH",
+                        help="known optimum tour lengths")
+    parser.add_argument("--format", choices=["json", "csv"],
+                        default="json")
+    parser.add_argument("--output", default=None,
+                        help="output file (default: stdout)")
+    parser.add_argument("--move-modes", type=int, default=None,
+                        metavar="N",
+                        help="only time uniform vs candidate moves on N "
+                             "cities (--iterations, --neighbors)")
+    args = parser.parse_args(argv)
+    if not args.tsplib and not args.sizes and not args.move_modes:
+        parser.error("give --tsplib files and/or --sizes")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.move_modes:
+        records = move_mode_benchmark(args.move_modes, args.iterations,
+                                      args.neighbors or 8, args.seeds[0])
+        write_records(records, args.format, sys.stdout)
+        return
+    known = dict(item.split("=", 1) for item in args.optimum)
+
+    instances = [tsplib_instance(path) for path in args.tsplib]
+    instances += [
+        synthetic_instance(n, seed)
+        for n in args.sizes for seed in args.seeds
+    ]
+
+    records = []
+    for name, cities, optimum, metric in instances:
+        if name in known:
+            optimum = float(known[name])
+        for cooling_type in args.cooling:
+            for seed in args.seeds:
+                options = {
+                    "cooling_type": cooling_type,
+                    "T_initial": args.T_initial,
+                    "alpha": args.alpha,
+                    "beta": args.beta,
+                    "max_iterations": args.iterations,
+                    "time_budget": args.time_budget,
+                    "neighbors": args.neighbors,
+                    "history_capacity": args.history_capacity,
+                }
+                records.append(
+                    run_case(name, cities, optimum, options, seed,
+                             metric)
+                )
+                print(
+                    f"{name} {cooling_type} seed={seed}: "
+                    f"{records[-1]['best_distance']:.1f} in "
+                    f"{records[-1]['wall_time_s']:.2f}s",
+                    file=sys.stderr,
+                )
+
+    if args.output:
+        newline = "" if args.format == "csv" else None
+        with open(args.output, "w", newline=newline) as out:
+            write_records(records, args.format, out)
+    else:
+        write_records(records, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
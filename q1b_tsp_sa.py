@@ -1,185 +1,1593 @@
-# ============================================================
-# QUESTION 1(b): Traveling Salesperson Problem (TSP)
-# Solved using Simulated Annealing with two cooling schedules
-# ============================================================
-
-import random
-import math
-import matplotlib.pyplot as plt
-
-# ------------------------------------------------------------
-# Fix random seed for reproducibility
-# ------------------------------------------------------------
-random.seed(42)
-
-# ------------------------------------------------------------
-# CITY GENERATION
-# ------------------------------------------------------------
-def generate_cities(n, lower=0, upper=1000):
-    """
-    Generates n cities with random (x, y) coordinates.
-    """
-    return [
-        (random.uniform(lower, upper),
-         random.uniform(lower, upper))
-        for _ in range(n)
-    ]
-
-
-# ------------------------------------------------------------
-# DISTANCE FUNCTIONS
-# ------------------------------------------------------------
-def euclidean_distance(a, b):
-    """
-    Computes Euclidean distance between two points.
-    """
-    return math.sqrt((a[0] - b[0])**2 + (a[1] - b[1])**2)
-
-
-def total_tour_distance(tour, cities):
-    """
-    Computes total distance of a closed TSP tour.
-    """
-    distance = 0
-    for i in range(len(tour)):
-        city_a = cities[tour[i]]
-        city_b = cities[tour[(i + 1) % len(tour)]]
-        distance += euclidean_distance(city_a, city_b)
-    return distance
-
-
-# ------------------------------------------------------------
-# NEIGHBORHOOD OPERATORS
-# ------------------------------------------------------------
-def swap_neighborhood(tour):
-    """
-    Swap two random cities in the tour.
-    """
-    i, j = random.sample(range(len(tour)), 2)
-    new_tour = tour[:]
-    new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
-    return new_tour
-
-
-def two_opt_neighborhood(tour):
-    """
-    Reverse a segment of the tour (2-opt move).
-    """
-    i, j = sorted(random.sample(range(len(tour)), 2))
-    return tour[:i] + tour[i:j][::-1] + tour[j:]
-
-
-# ------------------------------------------------------------
-# SIMULATED ANNEALING ALGORITHM
-# ------------------------------------------------------------
-def simulated_annealing(
-    cities,
-    cooling_type,
-    T_initial=800,
-    alpha=0.998,
-    beta=5,
-    max_iterations=2500
-):
-    """
-    Simulated Annealing algorithm for TSP.
-
-    cooling_type:
-    - 'exponential' : T = T * alpha
-    - 'linear'      : T = T - beta
-    """
-
-    n = len(cities)
-
-    # Initial random tour
-    current_tour = list(range(n))
-    random.shuffle(current_tour)
-
-    current_distance = total_tour_distance(current_tour, cities)
-    best_distance = current_distance
-
-    T = T_initial
-    history = []
-
-    for _ in range(max_iterations):
-
-        # Select neighborhood operator
-        if random.random() < 0.5:
-            new_tour = swap_neighborhood(current_tour)
-        else:
-            new_tour = two_opt_neighborhood(current_tour)
-
-        new_distance = total_tour_distance(new_tour, cities)
-        delta = new_distance - current_distance
-
-        # Acceptance condition
-        if delta < 0 or random.random() < math.exp(-delta / T):
-            current_tour = new_tour
-            current_distance = new_distance
-
-            if current_distance < best_distance:
-                best_distance = current_distance
-
-        history.append(best_distance)
-
-        # Cooling schedule
-        if cooling_type == "exponential":
-            T *= alpha
-        elif cooling_type == "linear":
-            T = max(0.001, T - beta)
-
-        # Stopping condition
-        if T <= 0.001:
-            break
-
-    return best_distance, history
-
-
-# ------------------------------------------------------------
-# MAIN EXECUTION
-# ------------------------------------------------------------
-if __name__ == "__main__":
-
-    # Number of cities
-    N = 35
-    cities = generate_cities(N)
-
-    # Run Simulated Annealing with Exponential Cooling
-    dist_exp, history_exp = simulated_annealing(
-        cities, cooling_type="exponential"
-    )
-
-    # Run Simulated Annealing with Linear Cooling
-    dist_lin, history_lin = simulated_annealing(
-        cities, cooling_type="linear"
-    )
-
-    # Comparison
-    improvement = dist_lin - dist_exp
-    improvement_percent = (improvement / dist_lin) * 100 if dist_lin != 0 else 0
-
-    print("\n================ FINAL COMPARISON ================")
-    print("Number of Cities:", N)
-    print("Exponential Cooling Distance:", round(dist_exp, 2))
-    print("Linear Cooling Distance     :", round(dist_lin, 2))
-
-    if improvement > 0:
-        print(
-            f"Exponential cooling improved the tour by "
-            f"{round(improvement, 2)} units "
-            f"({round(improvement_percent, 2)}%)."
-        )
-    else:
-        print("Both cooling schedules produced similar results.")
-
-    # --------------------------------------------------------
-    # Plot convergence graph
-    # --------------------------------------------------------
-    plt.figure(figsize=(8, 5))
-    plt.plot(history_exp, label="Exponential Cooling")
-    plt.plot(history_lin, label="Linear Cooling")
-    plt.xlabel("Iteration")
-    plt.ylabel("Best Tour Distance")
-    plt.title("Simulated Annealing – Cooling Schedule Comparison")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+# ============================================================
+# QUESTION 1(b): Traveling Salesperson Problem (TSP)
+# Solved using Simulated Annealing with two cooling schedules
+# ============================================================
+
+import hashlib
+import random
+import math
+import multiprocessing
+import os
+import pickle
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# SciPy (KD-trees) and matplotlib (plots) are imported inside the
+# functions that need them, so importing this module stays cheap.
+
+# ------------------------------------------------------------
+# CITY GENERATION
+# ------------------------------------------------------------
+def generate_cities(n, lower=0, upper=1000, rng=None):
+    """
+    Generates n cities with random (x, y) coordinates.
+    rng: optional random.Random for seeded instances.
+    """
+    if rng is None:
+        rng = random
+    return [
+        (rng.uniform(lower, upper),
+         rng.uniform(lower, upper))
+        for _ in range(n)
+    ]
+
+
+# ------------------------------------------------------------
+# TSPLIB FILES
+# ------------------------------------------------------------
+def load_tsplib(path):
+    """
+    Reads a TSPLIB instance with a NODE_COORD_SECTION and an
+    EDGE_WEIGHT_TYPE from TSPLIB_METRICS (EUC_2D when none is given);
+    any other type raises ValueError. Coordinates are returned as-is:
+    the annealer works on plain Euclidean distances between them, and
+    tsplib_tour_length scores a tour in the instance's own metric,
+    the one published optima use.
+
+    Returns:
+    cities : list of (x, y), in node order
+    header : dict of the specification part (NAME, DIMENSION, ...)
+    """
+    header = {}
+    cities = []
+    in_coords = False
+    with open(path) as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line == "EOF":
+                continue
+            if in_coords:
+                parts = line.split()
+                if len(parts) < 3 or not parts[0].lstrip("-").isdigit():
+                    in_coords = False   # next section starts
+                else:
+                    cities.append((float(parts[1]), float(parts[2])))
+                    continue
+            if line.startswith("NODE_COORD_SECTION"):
+                in_coords = True
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip().upper()] = value.strip()
+
+    if not cities:
+        raise ValueError(f"{path}: no NODE_COORD_SECTION found")
+    metric = header.setdefault("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+    if metric not in TSPLIB_METRICS:
+        raise ValueError(
+            f"{path}: EDGE_WEIGHT_TYPE {metric} is not supported "
+            f"(only {', '.join(TSPLIB_METRICS)})"
+        )
+    header["EDGE_WEIGHT_TYPE"] = metric
+    dimension = int(header.get("DIMENSION", len(cities)))
+    if dimension != len(cities):
+        raise ValueError(
+            f"{path}: DIMENSION is {dimension} but "
+            f"{len(cities)} coordinates were read"
+        )
+    return cities, header
+
+
+def load_tsplib_tour(path):
+    """
+    Reads a TSPLIB tour file (TOUR_SECTION, 1-based node ids ending
+    with -1) and returns the tour as 0-based city indices.
+    """
+    tour = []
+    in_tour = False
+    with open(path) as fh:
+        for line in fh:
+            line = line.strip()
+            if line.startswith("TOUR_SECTION"):
+                in_tour = True
+                continue
+            if not in_tour:
+                continue
+            for token in line.split():
+                node = int(token)
+                if node == -1:
+                    return tour
+                tour.append(node - 1)
+    return tour
+
+
+# Edge weight types of coordinate instances that tsplib_tour_length
+# implements (TSPLIB 95 specification, section 2)
+TSPLIB_METRICS = ("EUC_2D", "CEIL_2D", "ATT", "GEO")
+
+
+def _nint(x):
+    return int(x + 0.5)
+
+
+def _geo_radians(coordinate):
+    # DDD.MM (degrees and minutes) to radians, with TSPLIB's value of pi
+    degrees = int(coordinate)
+    minutes = coordinate - degrees
+    return 3.141592 * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+
+def tsplib_distance_function(cities, edge_weight_type="EUC_2D"):
+    """
+    Returns dist(a, b) over city indices in a TSPLIB metric: integer
+    distances, exactly as the TSPLIB specification defines them.
+    """
+    if edge_weight_type == "EUC_2D":
+        return lambda a, b: _nint(math.dist(cities[a], cities[b]))
+    if edge_weight_type == "CEIL_2D":
+        return lambda a, b: math.ceil(math.dist(cities[a], cities[b]))
+    if edge_weight_type == "ATT":
+        def att(a, b):
+            dx = cities[a][0] - cities[b][0]
+            dy = cities[a][1] - cities[b][1]
+            r = math.sqrt((dx * dx + dy * dy) / 10.0)
+            t = _nint(r)
+            return t + 1 if t < r else t
+        return att
+    if edge_weight_type == "GEO":
+        lat = [_geo_radians(c[0]) for c in cities]
+        lon = [_geo_radians(c[1]) for c in cities]
+
+        def geo(a, b):
+            q1 = math.cos(lon[a] - lon[b])
+            q2 = math.cos(lat[a] - lat[b])
+            q3 = math.cos(lat[a] + lat[b])
+            return int(6378.388 * math.acos(
+                0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)
+            ) + 1.0)
+        return geo
+    raise ValueError(f"unknown EDGE_WEIGHT_TYPE: {edge_weight_type!r}")
+
+
+def tsplib_tour_length(tour, cities, edge_weight_type="EUC_2D"):
+    """
+    Length of a closed tour in a TSPLIB metric, comparable with the
+    published optimum of the instance.
+    """
+    dist = tsplib_distance_function(cities, edge_weight_type)
+    return sum(dist(a, b) for a, b in zip(tour, tour[1:] + tour[:1]))
+
+
+# ------------------------------------------------------------
+# DISTANCE FUNCTIONS
+# ------------------------------------------------------------
+def euclidean_distance(a, b):
+    """
+    Computes Euclidean distance between two points.
+    """
+    return math.sqrt((a[0] - b[0])**2 + (a[1] - b[1])**2)
+
+
+def total_tour_distance(tour, cities):
+    """
+    Computes total distance of a closed TSP tour.
+    """
+    distance = 0
+    for i in range(len(tour)):
+        city_a = cities[tour[i]]
+        city_b = cities[tour[(i + 1) % len(tour)]]
+        distance += euclidean_distance(city_a, city_b)
+    return distance
+
+
+# ------------------------------------------------------------
+# NEIGHBORHOOD OPERATORS
+# ------------------------------------------------------------
+def swap_neighborhood(tour):
+    """
+    Swap two random cities in the tour.
+    """
+    i, j = random.sample(range(len(tour)), 2)
+    new_tour = tour[:]
+    new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
+    return new_tour
+
+
+def two_opt_neighborhood(tour):
+    """
+    Reverse a segment of the tour (2-opt move).
+    """
+    i, j = sorted(random.sample(range(len(tour)), 2))
+    return tour[:i] + tour[i:j][::-1] + tour[j:]
+
+
+# ------------------------------------------------------------
+# INCREMENTAL (DELTA) MOVE EVALUATION
+# ------------------------------------------------------------
+# dist(a, b) is the distance between cities a and b (by index).
+# A move only changes the few edges around positions i and j, so its
+# effect on the tour length is computed from those edges alone, in
+# O(1), and the tour is modified in place only if the move is accepted.
+
+def swap_delta(tour, i, j, dist):
+    """
+    Change in tour length if the cities at positions i and j are
+    swapped. Edge k joins positions k and k + 1.
+    """
+    n = len(tour)
+    ci, cj = tour[i], tour[j]
+    delta = 0.0
+    for k in {(i - 1) % n, i, (j - 1) % n, j}:
+        p, q = k, (k + 1) % n
+        a, b = tour[p], tour[q]
+        delta -= dist(a, b)
+        a = cj if p == i else ci if p == j else a
+        b = cj if q == i else ci if q == j else b
+        delta += dist(a, b)
+    return delta
+
+
+def two_opt_delta(tour, i, j, dist):
+    """
+    Change in tour length if the segment tour[i:j] is reversed
+    (0 <= i < j < n): edges (i-1, i) and (j-1, j) are replaced.
+    """
+    a, b = tour[i - 1], tour[i]
+    c, d = tour[j - 1], tour[j % len(tour)]
+    return dist(a, c) + dist(b, d) - dist(a, b) - dist(c, d)
+
+
+def apply_swap(tour, i, j, pos=None):
+    """
+    Swaps the cities at positions i and j in place.
+    pos (city -> position), if given, is kept in sync.
+    """
+    tour[i], tour[j] = tour[j], tour[i]
+    if pos is not None:
+        pos[tour[i]] = i
+        pos[tour[j]] = j
+
+
+def apply_two_opt(tour, i, j, pos=None):
+    """
+    Reverses tour[i:j] in place. When the segment is longer than half
+    the tour, the complementary (wrap-around) segment is reversed
+    instead; it yields the same cycle at lower cost.
+    pos (city -> position), if given, is kept in sync.
+    """
+    n = len(tour)
+    if pos is not None and min(j - i, n - j + i) >= VECTOR_REINDEX_MIN:
+        # Long segment: reverse and re-index through NumPy views
+        t = np.frombuffer(tour, dtype=np.int32)
+        p = np.frombuffer(pos, dtype=np.int32)
+        if 2 * (j - i) <= n:
+            segment = t[i:j][::-1].copy()
+            t[i:j] = segment
+            p[segment] = np.arange(i, j, dtype=np.int32)
+        else:
+            rest = np.concatenate((t[j:], t[:i]))[::-1]
+            t[j:] = rest[:n - j]
+            t[:i] = rest[n - j:]
+            p[rest] = np.r_[j:n, 0:i].astype(np.int32)
+        return
+    if 2 * (j - i) <= n:
+        tour[i:j] = tour[i:j][::-1]
+        if pos is not None:
+            _reindex(tour, pos, i, j)
+    else:
+        rest = (tour[j:] + tour[:i])[::-1]
+        tour[j:] = rest[:n - j]
+        tour[:i] = rest[n - j:]
+        if pos is not None:
+            _reindex(tour, pos, j, n)
+            _reindex(tour, pos, 0, i)
+
+
+# Position ranges at least this long are re-indexed through NumPy views
+# of the array('i') buffers; shorter ones in a plain loop
+VECTOR_REINDEX_MIN = 32
+
+
+def _reindex(tour, pos, lo, hi):
+    """Sets pos[tour[p]] = p for lo <= p < hi (tour, pos: array('i'))."""
+    if hi - lo < VECTOR_REINDEX_MIN:
+        for p in range(lo, hi):
+            pos[tour[p]] = p
+        return
+    cities = np.frombuffer(tour, dtype=np.int32)[lo:hi]
+    np.frombuffer(pos, dtype=np.int32)[cities] = np.arange(
+        lo, hi, dtype=np.int32
+    )
+
+
+# ------------------------------------------------------------
+# PRECOMPUTATION: DISTANCES AND CANDIDATE LISTS
+# ------------------------------------------------------------
+# Above this many cities a dense matrix costs too much memory, and
+# distances are computed from coordinates on demand instead.
+DENSE_MATRIX_LIMIT = 2000
+
+
+def build_distance_matrix(cities):
+    """
+    Dense (n, n) NumPy matrix of pairwise Euclidean distances.
+    """
+    xy = np.asarray(cities, dtype=float)
+    diff = xy[:, None, :] - xy[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=2))
+
+
+def build_candidate_lists(cities, k=10):
+    """
+    For every city, its k nearest other cities (closest first), found
+    with a KD-tree instead of an all-pairs scan.
+    """
+    from scipy.spatial import cKDTree
+
+    xy = np.asarray(cities, dtype=float)
+    k = min(k, len(xy) - 1)
+    _, idx = cKDTree(xy).query(xy, k=k + 1)
+    # Column 0 is normally the city itself; drop it (or duplicates)
+    return [
+        [c for c in row if c != city][:k]
+        for city, row in enumerate(idx.reshape(len(xy), -1).tolist())
+    ]
+
+
+def make_distance_function(cities, dense_limit=DENSE_MATRIX_LIMIT):
+    """
+    Returns dist(a, b) over city indices: a lookup into a precomputed
+    matrix for small instances, plain coordinate arithmetic otherwise.
+
+    The matrix is kept as one flat array('d') (8 bytes per entry, read
+    at a * n + b); nested lists of Python floats would cost about six
+    times as much in every process that builds one.
+    """
+    n = len(cities)
+    if n <= dense_limit:
+        xy = np.asarray(cities, dtype=float)
+        x, y = xy[:, 0], xy[:, 1]
+        flat = array("d", bytes(8 * n * n))
+        matrix = np.frombuffer(flat).reshape(n, n)
+        # Filled in row blocks, so no (n, n) temporaries are needed
+        for lo in range(0, n, 256):
+            hi = min(lo + 256, n)
+            dx = x[lo:hi, None] - x
+            dy = y[lo:hi, None] - y
+            np.sqrt(dx * dx + dy * dy, out=matrix[lo:hi])
+        del matrix
+        return lambda a, b: flat[a * n + b]
+    xs = [float(c[0]) for c in cities]
+    ys = [float(c[1]) for c in cities]
+    return lambda a, b: math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+
+# ------------------------------------------------------------
+# BOUNDED CONVERGENCE HISTORY
+# ------------------------------------------------------------
+class HistoryRecorder:
+    """
+    Convergence history with bounded memory.
+
+    Keeps every `interval`-th appended value in a preallocated
+    array('d') of `capacity` slots. When the buffer fills up, every
+    other sample is dropped and the interval doubles, so the samples
+    stay evenly spaced and memory stays constant on arbitrarily long
+    runs. capacity=None grows without bound (the default keeps every
+    value, like a plain list).
+
+    Behaves as a read-only sequence of the recorded values; sample k
+    belongs to iteration k * interval.
+    """
+
+    def __init__(self, interval=1, capacity=None):
+        if interval < 1 or (capacity is not None and capacity < 2):
+            raise ValueError("interval must be >= 1 and capacity >= 2")
+        self.interval = interval
+        self.capacity = capacity
+        self._values = array("d", bytes(8 * capacity) if capacity else b"")
+        self._size = 0
+        self._seen = 0
+
+    def append(self, value):
+        seen = self._seen
+        self._seen = seen + 1
+        if seen % self.interval:
+            return
+        if self.capacity is None:
+            self._values.append(value)
+        else:
+            if self._size == self.capacity:
+                # Decimate: keep samples at even positions only
+                kept = self._values[0:self._size:2]
+                self._values[0:len(kept)] = kept
+                self._size = len(kept)
+                self.interval *= 2
+                if seen % self.interval:
+                    return
+            self._values[self._size] = value
+        self._size += 1
+
+    @property
+    def appended(self):
+        """Number of values appended so far (recorded or not)."""
+        return self._seen
+
+    def iterations(self):
+        """Iteration index of every recorded sample."""
+        return range(0, self._size * self.interval, self.interval)
+
+    def values(self):
+        """Recorded samples as a compact array('d')."""
+        return self._values[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.values()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+        return self._values[index]
+
+    def __iter__(self):
+        return iter(self.values())
+
+    def __repr__(self):
+        return (f"HistoryRecorder(samples={self._size}, "
+                f"interval={self.interval})")
+
+
+# ------------------------------------------------------------
+# ANNEALING CHAIN (METROPOLIS STATE)
+# ------------------------------------------------------------
+# Candidate draws per proposal before falling back to a uniform swap
+CANDIDATE_REDRAWS = 8
+
+
+class AnnealingChain:
+    """
+    State of one Metropolis chain over tours: the current tour (plus a
+    city -> position index when candidate lists are used), its length,
+    and the best tour seen so far. run() advances the chain and can be
+    called repeatedly, e.g. once per replica-exchange round.
+
+    Tours and positions are array('i') buffers (4 bytes per city),
+    modified in place by the move operators.
+    """
+
+    def __init__(self, cities, rng=None, dist=None, candidates=None,
+                 dense_limit=DENSE_MATRIX_LIMIT):
+        self.rng = random if rng is None else rng
+        self.n = len(cities)
+        self.dist = dist or make_distance_function(cities, dense_limit)
+        self.candidates = candidates
+
+        # Initial random tour
+        self.tour = array("i", range(self.n))
+        self.rng.shuffle(self.tour)
+
+        self.current_distance = total_tour_distance(self.tour, cities)
+        self.best_distance = self.current_distance
+        # Snapshot of the best tour; None while the current tour is the
+        # best, so a copy is only taken when a worse move leaves it
+        self._best_tour = None
+        self.iterations = 0
+        # Counters for early stopping (see run)
+        self.accepted = 0
+        self.last_improvement = 0
+        self.window_mark = 0   # accepted count at the last window start
+        self.stop_reason = None
+
+        self.pos = None
+        if candidates is not None:
+            self.pos = array("i", bytes(4 * self.n))
+            for p, city in enumerate(self.tour):
+                self.pos[city] = p
+
+    @property
+    def best_tour(self):
+        if self._best_tour is None:
+            return self.tour[:]
+        return self._best_tour
+
+    def get_state(self):
+        """Everything needed to continue the chain bit-for-bit."""
+        return {
+            "tour": self.tour,
+            "pos": self.pos,
+            "current_distance": self.current_distance,
+            "best_distance": self.best_distance,
+            "best_tour": self._best_tour,
+            "iterations": self.iterations,
+            "accepted": self.accepted,
+            "last_improvement": self.last_improvement,
+            "window_mark": self.window_mark,
+            "rng_state": self.rng.getstate(),
+        }
+
+    @classmethod
+    def from_state(cls, state, dist, candidates=None):
+        """Rebuilds a chain saved with get_state()."""
+        chain = cls.__new__(cls)
+        chain.rng = random.Random()
+        chain.rng.setstate(state["rng_state"])
+        chain.n = len(state["tour"])
+        chain.dist = dist
+        chain.candidates = candidates
+        chain.tour = state["tour"]
+        chain.pos = state["pos"]
+        chain.current_distance = state["current_distance"]
+        chain.best_distance = state["best_distance"]
+        chain._best_tour = state["best_tour"]
+        chain.iterations = state["iterations"]
+        chain.accepted = state["accepted"]
+        chain.last_improvement = state["last_improvement"]
+        chain.window_mark = state["window_mark"]
+        chain.stop_reason = None
+        return chain
+
+    def propose(self):
+        """
+        Draws a random move and evaluates it in O(1) without applying it.
+
+        Returns:
+        (apply_move, i, j, delta)
+        """
+        rng = self.rng
+        n = self.n
+        pos = self.pos
+        candidates = self.candidates
+
+        # Select neighborhood operator
+        use_swap = rng.random() < 0.5
+        if candidates is None:
+            i, j = sorted(rng.sample(range(n), 2))
+            # Reversing one city, or every city but one, leaves the tour
+            # unchanged (and is always accepted); draw again
+            while not use_swap and not 1 < j - i < n - 1 and n > 3:
+                i, j = sorted(rng.sample(range(n), 2))
+        else:
+            # A neighbour already next to a gives a move that leaves the
+            # tour unchanged (and is always accepted); draw again
+            for _ in range(CANDIDATE_REDRAWS):
+                a = rng.randrange(n)
+                c = rng.choice(candidates[a])
+                if use_swap:
+                    # Swap the neighbour into the position after city a
+                    i, j = sorted(((pos[a] + 1) % n, pos[c]))
+                    if i != j:
+                        break
+                else:
+                    # Reverse (pos[a], pos[c]] so a and c become adjacent
+                    i, j = sorted((pos[a], pos[c]))
+                    i, j = i + 1, j + 1
+                    if 1 < j - i < n - 1:
+                        break
+            else:
+                # Only such moves were drawn (e.g. a tiny instance)
+                use_swap = True
+                i, j = sorted(rng.sample(range(n), 2))
+
+        if use_swap:
+            return apply_swap, i, j, swap_delta(self.tour, i, j, self.dist)
+        return apply_two_opt, i, j, two_opt_delta(self.tour, i, j, self.dist)
+
+    def sample_deltas(self, samples):
+        """Length changes of `samples` random moves (none applied)."""
+        return [self.propose()[3] for _ in range(samples)]
+
+    def run(self, T, steps, cooling_type=None, alpha=0.998, beta=5,
+            history=None, patience=None, min_acceptance=None,
+            window=1000):
+        """
+        Performs up to `steps` Metropolis steps starting at temperature
+        T, cooling after each step ('exponential', 'linear' or None for
+        a fixed temperature). Appends the best distance to `history`
+        after every step if a list is given.
+
+        Early stopping (sets stop_reason):
+        - 'frozen'              : T fell to 0.001
+        - 'stagnation'          : no new best for `patience` iterations
+        - 'acceptance_collapse' : fewer than min_acceptance * window
+                                  moves accepted in the last window
+        propose() never draws a move that leaves the tour unchanged, so
+        a frozen chain accepts nothing (also for the acceptance_rate in
+        run statistics).
+
+        Returns the temperature reached.
+        """
+        rng = self.rng
+        propose = self.propose
+        pos = self.pos
+        current_tour = self.tour
+        current_distance = self.current_distance
+        best_distance = self.best_distance
+        best_tour = self._best_tour
+        iteration = self.iterations
+        accepted = self.accepted
+        last_improvement = self.last_improvement
+        window_mark = self.window_mark
+        stop_reason = None
+
+        for _ in range(steps):
+            iteration += 1
+            apply_move, i, j, delta = propose()
+
+            # Acceptance condition (tour is only modified when accepted)
+            if delta < 0 or rng.random() < math.exp(-delta / T):
+                if delta > 0 and best_tour is None:
+                    best_tour = current_tour[:]
+                apply_move(current_tour, i, j, pos)
+                current_distance += delta
+                accepted += 1
+
+                if current_distance < best_distance:
+                    best_distance = current_distance
+                    best_tour = None
+                    last_improvement = iteration
+
+            if history is not None:
+                history.append(best_distance)
+
+            # Early stopping
+            if patience is not None and iteration - last_improvement >= patience:
+                stop_reason = "stagnation"
+                break
+            if min_acceptance is not None and iteration % window == 0:
+                if accepted - window_mark < min_acceptance * window:
+                    stop_reason = "acceptance_collapse"
+                    break
+                window_mark = accepted
+
+            # Cooling schedule
+            if cooling_type == "exponential":
+                T *= alpha
+            elif cooling_type == "linear":
+                T = max(0.001, T - beta)
+
+            # Stopping condition
+            if T <= 0.001:
+                stop_reason = "frozen"
+                break
+
+        self.current_distance = current_distance
+        self.best_distance = best_distance
+        self._best_tour = best_tour
+        self.iterations = iteration
+        self.accepted = accepted
+        self.last_improvement = last_improvement
+        self.window_mark = window_mark
+        self.stop_reason = stop_reason
+        return T
+
+
+# ------------------------------------------------------------
+# LOCAL SEARCH POLISHING (2-OPT + OR-OPT, DON'T-LOOK BITS)
+# ------------------------------------------------------------
+def _or_opt_move(tour, pos, i, length, k, reverse):
+    """
+    Moves the segment tour[i:i+length] so that it sits right after
+    position k (k outside the segment), optionally reversed.
+    Only the positions between the old and new place are rewritten.
+    """
+    segment = tour[i:i + length]
+    if reverse:
+        segment.reverse()
+    if k > i:
+        tour[i:k + 1] = tour[i + length:k + 1] + segment
+        _reindex(tour, pos, i, k + 1)
+    else:
+        tour[k + 1:i + length] = segment + tour[k + 1:i]
+        _reindex(tour, pos, k + 1, i + length)
+
+
+def polish_tour(tour, cities, neighbors=8, dist=None, candidates=None,
+                or_opt=True, max_segment=3):
+    """
+    Deterministic local search run to a local optimum.
+
+    Uses neighbour lists (each city only looks at its nearest
+    candidates) and don't-look bits: a city is re-examined only after
+    one of its tour edges changed. Sweeps repeat until one leaves the
+    tour unchanged, so no move below can shorten the result. Moves:
+    - 2-opt : replace edges (a, succ a), (c, succ c) with (a, c),
+              (succ a, succ c); likewise with predecessors
+    - Or-opt: move a segment of 1..max_segment cities starting at a
+              between a candidate and its successor, in either
+              orientation
+
+    Returns:
+    tour     : improved tour (a new array('i'))
+    distance : its length
+    """
+    n = len(tour)
+    tour = array("i", tour)
+    if n < 5:
+        return tour, total_tour_distance(tour, cities)
+    if dist is None:
+        dist = make_distance_function(cities)
+    if candidates is None:
+        candidates = build_candidate_lists(cities, neighbors)
+
+    pos = array("i", bytes(4 * n))
+    for p, city in enumerate(tour):
+        pos[city] = p
+
+    eps = 1e-10
+    active = [True] * n
+    queue = deque(tour)
+
+    def wake(*cities_to_wake):
+        for city in cities_to_wake:
+            if not active[city]:
+                active[city] = True
+                queue.append(city)
+
+    def improve(a):
+        i = pos[a]
+
+        # 2-opt, successor and predecessor directions
+        for step in (1, -1):
+            b = tour[(i + step) % n]
+            d_ab = dist(a, b)
+            for c in candidates[a]:
+                g1 = d_ab - dist(a, c)
+                if g1 <= eps:
+                    break   # candidates are sorted by distance
+                j = pos[c]
+                d = tour[(j + step) % n]
+                if d == a or c == b:
+                    continue
+                if g1 + dist(c, d) - dist(b, d) > eps:
+                    lo, hi = sorted((i, j))
+                    if step == 1:
+                        apply_two_opt(tour, lo + 1, hi + 1, pos)
+                    else:
+                        apply_two_opt(tour, lo, hi, pos)
+                    wake(a, b, c, d)
+                    return True
+
+        if not or_opt:
+            return False
+
+        # Or-opt: segment tour[i:i+length] starting at a
+        for length in range(1, max_segment + 1):
+            if i + length >= n:
+                break
+            first, last = tour[i], tour[i + length - 1]
+            p, nx = tour[i - 1], tour[i + length]
+            removed = dist(p, first) + dist(last, nx) - dist(p, nx)
+            if removed <= eps:
+                continue
+            in_segment = set(tour[i:i + length])
+            for c in candidates[first] + candidates[last]:
+                if c in in_segment:
+                    continue
+                for u in (c, tour[pos[c] - 1]):
+                    v = tour[(pos[u] + 1) % n]
+                    if u in in_segment or v in in_segment:
+                        continue
+                    base = dist(u, v)
+                    forward = dist(u, first) + dist(last, v) - base
+                    backward = dist(u, last) + dist(first, v) - base
+                    if removed - min(forward, backward) > eps:
+                        _or_opt_move(tour, pos, i, length, pos[u],
+                                     backward < forward)
+                        wake(first, last, p, nx, u, v)
+                        return True
+        return False
+
+    # Don't-look bits only wake the endpoints of a move, but a changed
+    # edge can also open a move for any city that has an endpoint among
+    # its candidates; sweep again until a full sweep changes nothing
+    while True:
+        moved = False
+        while queue:
+            a = queue.popleft()
+            if improve(a):
+                moved = True
+                queue.append(a)   # keep working on a while it improves
+            else:
+                active[a] = False
+        if not moved:
+            break
+        wake(*tour)
+
+    return tour, total_tour_distance(tour, cities)
+
+
+# ------------------------------------------------------------
+# CHECKPOINTS
+# ------------------------------------------------------------
+CHECKPOINT_MAGIC = b"TSPSA-CKPT-1\n"
+
+# History slots used when checkpointing without a history_capacity: an
+# unbounded history would make every checkpoint larger than the last
+CHECKPOINT_HISTORY_CAPACITY = 4096
+
+
+def save_checkpoint(path, state):
+    """
+    Writes an annealing checkpoint: a magic header followed by a binary
+    pickle whose tours are array('i') buffers. The file is written to
+    a temporary name and renamed, so a crash mid-write never leaves a
+    torn checkpoint behind.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(CHECKPOINT_MAGIC)
+        pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """Reads a checkpoint written by save_checkpoint."""
+    with open(path, "rb") as fh:
+        if fh.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError(f"{path}: not an annealing checkpoint")
+        return pickle.load(fh)
+
+
+def _cities_fingerprint(cities):
+    coords = array("d", (v for city in cities for v in city[:2]))
+    return hashlib.sha1(coords.tobytes()).hexdigest()
+
+
+# ------------------------------------------------------------
+# SIMULATED ANNEALING ALGORITHM
+# ------------------------------------------------------------
+# With a time budget or checkpoints the chain runs in blocks, and the
+# clock / checkpoint writer is only consulted between blocks.
+TIME_CHECK_INTERVAL = 4096
+
+
+def calibrate_temperature(chain, target_acceptance=0.8, samples=1000):
+    """
+    Picks the starting temperature from the instance itself: samples
+    random moves from the chain's current tour and solves, by bisection
+    on log T,
+
+        mean(exp(-delta / T)) over the worsening moves = target
+
+    i.e. T at which that fraction of uphill moves would be accepted
+    (improving moves always are). The result scales with the typical
+    edge length, so the same target works for instances of any size or
+    unit.
+
+    Returns:
+    T_initial (float)
+    """
+    if not 0 < target_acceptance < 1:
+        raise ValueError("target_acceptance must be in (0, 1)")
+    worse = [d for d in chain.sample_deltas(samples) if d > 0]
+    if not worse:
+        return 1.0
+
+    def acceptance(T):
+        return sum(math.exp(-d / T) for d in worse) / len(worse)
+
+    # -mean / ln(target) brackets the root: by Jensen's inequality the
+    # acceptance there is at least the target
+    hi = -sum(worse) / len(worse) / math.log(target_acceptance)
+    lo = hi
+    while acceptance(lo) >= target_acceptance:
+        lo /= 10
+    lo, hi = math.log(lo), math.log(hi)
+    for _ in range(50):
+        mid = 0.5 * (lo + hi)
+        if acceptance(math.exp(mid)) < target_acceptance:
+            lo = mid
+        else:
+            hi = mid
+    return math.exp(hi)
+
+
+def _drive(chain, T, schedule, history, time_budget=None, checkpoint=None):
+    """
+    Advances the chain from temperature T until the schedule is
+    exhausted (max_iterations or T <= 0.001), an early-stopping rule
+    fires or the time budget runs out, writing checkpoints every
+    checkpoint["every"] iterations.
+
+    Returns:
+    (T, stop_reason)
+    """
+    max_iterations = schedule["max_iterations"]
+    cooling = (schedule["cooling_type"], schedule["alpha"], schedule["beta"])
+    stopping = {
+        "patience": schedule.get("patience"),
+        "min_acceptance": schedule.get("min_acceptance"),
+        "window": schedule.get("acceptance_window", 1000),
+    }
+
+    if time_budget is None and checkpoint is None:
+        T = chain.run(T, max_iterations - chain.iterations, *cooling,
+                      history, **stopping)
+        return T, chain.stop_reason or "max_iterations"
+
+    block = max_iterations
+    if time_budget is not None:
+        deadline = time.perf_counter() + time_budget
+        block = min(block, TIME_CHECK_INTERVAL)
+    if checkpoint is not None:
+        block = min(block, checkpoint["every"])
+
+    stop_reason = "max_iterations"
+    while chain.iterations < max_iterations and T > 0.001:
+        if time_budget is not None and time.perf_counter() >= deadline:
+            stop_reason = "time_budget"
+            break
+        steps = min(block, max_iterations - chain.iterations)
+        if checkpoint is not None:
+            # Stop exactly on the next checkpoint boundary
+            every = checkpoint["every"]
+            steps = min(steps, every - chain.iterations % every)
+        T = chain.run(T, steps, *cooling, history, **stopping)
+        stopped = chain.stop_reason is not None
+        if checkpoint is not None and (
+            chain.iterations % checkpoint["every"] == 0
+            or chain.iterations >= max_iterations or stopped
+        ):
+            save_checkpoint(checkpoint["path"], {
+                "fingerprint": checkpoint["fingerprint"],
+                "schedule": schedule,
+                "T": T,
+                "chain": chain.get_state(),
+                "history": history,
+            })
+        if stopped:
+            stop_reason = chain.stop_reason
+            break
+    else:
+        if T <= 0.001:
+            stop_reason = "frozen"
+    return T, stop_reason
+
+
+def _finish(chain, history, cities, candidates, polish, return_tour,
+            stats=None):
+    best_distance, best_tour = chain.best_distance, chain.best_tour
+    if polish:
+        best_tour, polished = polish_tour(
+            best_tour, cities, dist=chain.dist, candidates=candidates
+        )
+        best_distance = min(best_distance, polished)
+
+    result = (best_distance, history)
+    if return_tour:
+        result += (best_tour,)
+    if stats is not None:
+        result += (stats,)
+    return result
+
+
+def _run_stats(chain, schedule, T, stop_reason):
+    return {
+        "iterations": chain.iterations,
+        "stop_reason": stop_reason,
+        "T_initial": schedule["T_initial"],
+        "T_final": T,
+        "acceptance_rate": (chain.accepted / chain.iterations
+                            if chain.iterations else 0.0),
+    }
+
+
+def simulated_annealing(
+    cities,
+    cooling_type,
+    T_initial=800,
+    alpha=0.998,
+    beta=5,
+    max_iterations=2500,
+    neighbors=None,
+    dense_limit=DENSE_MATRIX_LIMIT,
+    rng=None,
+    dist=None,
+    return_tour=False,
+    polish=False,
+    history_interval=1,
+    history_capacity=None,
+    time_budget=None,
+    checkpoint_path=None,
+    checkpoint_every=100_000,
+    target_acceptance=0.8,
+    calibration_samples=1000,
+    patience=None,
+    min_acceptance=None,
+    acceptance_window=1000,
+    return_stats=False
+):
+    """
+    Simulated Annealing algorithm for TSP.
+
+    cooling_type:
+    - 'exponential' : T = T * alpha
+    - 'linear'      : T = T - beta
+
+    T_initial:
+    - a number : fixed starting temperature
+    - 'auto'   : calibrate_temperature picks T so that about
+                 target_acceptance of random moves (estimated from
+                 calibration_samples moves) would be accepted
+
+    neighbors:
+    - None : moves pick two positions uniformly at random
+    - k    : moves join a random city to one of its k nearest
+             neighbours (2-opt makes them adjacent, swap moves the
+             neighbour next to it)
+    - a precomputed list from build_candidate_lists
+
+    rng         : random.Random instance (default: the global random
+                  module)
+    dist        : precomputed dist(a, b); default built by
+                  make_distance_function (dense matrix up to dense_limit
+                  cities)
+    return_tour : also return the best tour found
+    polish      : run polish_tour (2-opt + Or-opt to a local optimum) on
+                  the best tour; best_distance is then the polished
+                  length, history still covers the annealing phase only
+
+    history_interval : record the best distance every this many
+                       iterations
+    history_capacity : optional fixed number of history slots (the
+                       recorder decimates when full, see
+                       HistoryRecorder); with checkpoint_path it
+                       defaults to CHECKPOINT_HISTORY_CAPACITY, so
+                       checkpoints keep a constant size
+    time_budget      : optional wall-time limit in seconds, checked
+                       every TIME_CHECK_INTERVAL iterations
+    checkpoint_path  : if set, the full run state (tours, temperature,
+                       iteration counter, RNG state, history) is saved
+                       there every checkpoint_every iterations and at
+                       the end; continue with resume_annealing
+
+    Early stopping (max_iterations stays an upper bound):
+    patience          : stop after this many iterations without a new
+                        best tour
+    min_acceptance    : stop when fewer than this fraction of moves
+                        was accepted in the last acceptance_window
+                        iterations
+    return_stats      : also return a dict with iterations, stop_reason
+                        ('max_iterations', 'frozen', 'stagnation',
+                        'acceptance_collapse' or 'time_budget'),
+                        T_initial, T_final and acceptance_rate
+
+    Returns:
+    best_distance, history[, best_tour][, stats]
+    history is a HistoryRecorder; best_tour an array('i')
+    """
+
+    if isinstance(neighbors, int):
+        neighbors = build_candidate_lists(cities, neighbors)
+
+    chain = AnnealingChain(cities, rng, dist, neighbors or None, dense_limit)
+    if checkpoint_path is not None and history_capacity is None:
+        history_capacity = CHECKPOINT_HISTORY_CAPACITY
+    history = HistoryRecorder(history_interval, history_capacity)
+    if T_initial == "auto":
+        T_initial = calibrate_temperature(chain, target_acceptance,
+                                          calibration_samples)
+    schedule = {
+        "cooling_type": cooling_type,
+        "T_initial": T_initial,
+        "alpha": alpha,
+        "beta": beta,
+        "max_iterations": max_iterations,
+        # Candidate lists are rebuilt from k on resume
+        "neighbors": len(neighbors[0]) if neighbors else None,
+        "dense_limit": dense_limit,
+        "patience": patience,
+        "min_acceptance": min_acceptance,
+        "acceptance_window": acceptance_window,
+    }
+    checkpoint = None
+    if checkpoint_path is not None:
+        checkpoint = {
+            "path": checkpoint_path,
+            "every": checkpoint_every,
+            "fingerprint": _cities_fingerprint(cities),
+        }
+
+    T, stop_reason = _drive(chain, T_initial, schedule, history,
+                            time_budget, checkpoint)
+    stats = _run_stats(chain, schedule, T, stop_reason) if return_stats else None
+    return _finish(chain, history, cities, neighbors or None, polish,
+                   return_tour, stats)
+
+
+def resume_annealing(
+    checkpoint_path,
+    cities,
+    max_iterations=None,
+    time_budget=None,
+    checkpoint_every=100_000,
+    return_tour=False,
+    polish=False,
+    return_stats=False
+):
+    """
+    Continues a simulated_annealing run from its last checkpoint.
+
+    The chain, temperature, RNG stream and history are restored
+    exactly, so the continued run is bit-for-bit identical to one that
+    was never interrupted. New checkpoints keep going to the same file.
+
+    cities         : the same cities the run was started with
+    max_iterations : optionally extend (or shorten) the original budget
+
+    The early-stopping settings of the original run still apply.
+
+    Returns:
+    same as simulated_annealing
+    """
+    saved = load_checkpoint(checkpoint_path)
+    fingerprint = _cities_fingerprint(cities)
+    if saved["fingerprint"] != fingerprint:
+        raise ValueError("checkpoint was written for different cities")
+
+    schedule = dict(saved["schedule"])
+    if max_iterations is not None:
+        schedule["max_iterations"] = max_iterations
+
+    candidates = None
+    if schedule["neighbors"]:
+        candidates = build_candidate_lists(cities, schedule["neighbors"])
+    dist = make_distance_function(cities, schedule["dense_limit"])
+    chain = AnnealingChain.from_state(saved["chain"], dist, candidates)
+    history = saved["history"]
+
+    checkpoint = {
+        "path": checkpoint_path,
+        "every": checkpoint_every,
+        "fingerprint": fingerprint,
+    }
+    T, stop_reason = _drive(chain, saved["T"], schedule, history,
+                            time_budget, checkpoint)
+    stats = _run_stats(chain, schedule, T, stop_reason) if return_stats else None
+    return _finish(chain, history, cities, candidates, polish, return_tour,
+                   stats)
+
+
+# ------------------------------------------------------------
+# MULTI-START DRIVER (PROCESS POOL)
+# ------------------------------------------------------------
+# City data and precomputed tables, set once per worker process by the
+# pool initializer so that tasks only carry a seed.
+_WORKER = {}
+
+
+def _init_sa_worker(cities, neighbors, dense_limit):
+    _WORKER["cities"] = cities
+    _WORKER["dist"] = make_distance_function(cities, dense_limit)
+    _WORKER["neighbors"] = (
+        build_candidate_lists(cities, neighbors) if neighbors else None
+    )
+
+
+def _run_sa_chain(seed, cooling_type, options):
+    return simulated_annealing(
+        _WORKER["cities"],
+        cooling_type,
+        neighbors=_WORKER["neighbors"],
+        rng=random.Random(seed),
+        dist=_WORKER["dist"],
+        return_tour=True,
+        **options
+    )
+
+
+def chain_seeds(seed, chains):
+    """
+    Derives independent, reproducible integer seeds (one per chain)
+    from a root seed via NumPy's SeedSequence.
+    """
+    return [
+        int(child.generate_state(1, dtype=np.uint64)[0])
+        for child in np.random.SeedSequence(seed).spawn(chains)
+    ]
+
+
+def multi_start_annealing(
+    cities,
+    chains=8,
+    cooling_type="exponential",
+    workers=None,
+    seed=None,
+    neighbors=None,
+    dense_limit=DENSE_MATRIX_LIMIT,
+    **options
+):
+    """
+    Runs independent simulated_annealing chains across a process pool.
+
+    Every chain draws from its own random.Random stream, seeded from
+    chain_seeds(seed, chains), so a run is reproducible regardless of
+    worker count or scheduling. Cities (and the distance / candidate
+    tables) are sent to each worker once via the pool initializer.
+
+    workers : process count (None = CPU count, 1 = run in-process)
+    options : forwarded to simulated_annealing (T_initial, alpha, ...)
+
+    Returns:
+    best_distance : shortest tour length over all chains
+    best_tour     : that tour
+    histories     : per-chain convergence histories
+    """
+    seeds = chain_seeds(seed, chains)
+    initargs = (cities, neighbors, dense_limit)
+
+    if workers == 1:
+        _init_sa_worker(*initargs)
+        results = [_run_sa_chain(s, cooling_type, options) for s in seeds]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_sa_worker,
+            initargs=initargs,
+        ) as pool:
+            results = list(pool.map(
+                _run_sa_chain,
+                seeds, [cooling_type] * chains, [options] * chains,
+            ))
+
+    best_distance, _, best_tour = min(results, key=lambda r: r[0])
+    histories = [history for _, history, _ in results]
+    return best_distance, best_tour, histories
+
+
+# ------------------------------------------------------------
+# PARALLEL TEMPERING (REPLICA EXCHANGE)
+# ------------------------------------------------------------
+def temperature_ladder(T_min, T_max, replicas):
+    """Geometric ladder of `replicas` temperatures from T_min to T_max."""
+    if replicas == 1:
+        return [T_min]
+    ratio = (T_max / T_min) ** (1 / (replicas - 1))
+    return [T_min * ratio ** k for k in range(replicas)]
+
+
+class _ReplicaHost:
+    """
+    Owns a group of replicas (AnnealingChain objects) inside one worker
+    process and answers the coordinator's requests.
+    """
+
+    def __init__(self, cities, replica_seeds, neighbors, dense_limit):
+        dist = make_distance_function(cities, dense_limit)
+        candidates = (
+            build_candidate_lists(cities, neighbors) if neighbors else None
+        )
+        self.chains = {
+            r: AnnealingChain(cities, random.Random(seed), dist, candidates)
+            for r, seed in replica_seeds.items()
+        }
+
+    def handle(self, request):
+        command = request[0]
+        if command == "run":
+            # Fixed-temperature sweep of every hosted replica
+            _, temperatures, steps = request
+            for r, T in temperatures.items():
+                self.chains[r].run(T, steps)
+            return {
+                r: (chain.current_distance, chain.best_distance)
+                for r, chain in self.chains.items()
+            }
+        if command == "best":
+            chain = self.chains[request[1]]
+            return chain.best_distance, chain.best_tour
+        raise ValueError(f"unknown request: {command!r}")
+
+
+def _replica_worker(conn, *host_args):
+    host = _ReplicaHost(*host_args)
+    while True:
+        request = conn.recv()
+        if request[0] == "stop":
+            break
+        conn.send(host.handle(request))
+    conn.close()
+
+
+def parallel_tempering(
+    cities,
+    temperatures=None,
+    replicas=8,
+    T_min=1.0,
+    T_max=800.0,
+    rounds=200,
+    steps_per_round=500,
+    workers=None,
+    seed=None,
+    neighbors=None,
+    dense_limit=DENSE_MATRIX_LIMIT,
+    target=None
+):
+    """
+    Replica-exchange Monte Carlo for TSP.
+
+    One chain runs at every temperature of a fixed ladder. Replicas
+    live in persistent worker processes and each round every replica
+    performs `steps_per_round` Metropolis steps at its temperature.
+    Then neighbouring rungs (even pairs on even rounds, odd pairs on odd
+    rounds) swap with probability
+        min(1, exp((1/T_k - 1/T_k+1) * (E_k - E_k+1))).
+    A swap exchanges temperatures, not tours, so no tour ever crosses a
+    process boundary during the run.
+
+    temperatures : explicit ladder (default: geometric T_min .. T_max)
+    workers      : worker processes (None = CPU count, 1 = in-process)
+    target       : optional tour length; the run stops once reached
+
+    Returns:
+    best_distance : shortest tour length found by any replica
+    best_tour     : that tour
+    trace         : list of (elapsed_seconds, best_distance) per round
+    """
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1")
+    started = time.perf_counter()
+    if temperatures is None:
+        temperatures = temperature_ladder(T_min, T_max, replicas)
+    temperatures = sorted(temperatures)
+    replicas = len(temperatures)
+
+    seeds = chain_seeds(seed, replicas + 1)
+    exchange_rng = random.Random(seeds[-1])
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, replicas))
+
+    # Replica r starts on rung r; rung_of[r] tracks its temperature
+    rung_of = list(range(replicas))
+    groups = [
+        {r: seeds[r] for r in range(w, replicas, workers)}
+        for w in range(workers)
+    ]
+    host_of = [r % workers for r in range(replicas)]
+
+    if workers == 1:
+        local = _ReplicaHost(cities, groups[0], neighbors, dense_limit)
+        hosts = [local.handle]
+        processes = []
+    else:
+        hosts, processes = [], []
+        for group in groups:
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_replica_worker,
+                args=(child_conn, cities, group, neighbors, dense_limit),
+                daemon=True,
+            )
+            process.start()
+            # Only the worker may hold its end: if it dies, recv() on
+            # ours then raises EOFError instead of blocking forever
+            child_conn.close()
+            processes.append((process, parent_conn))
+
+            def request(message, conn=parent_conn):
+                conn.send(message)
+                return conn.recv()
+            hosts.append(request)
+
+    energy = [0.0] * replicas
+    best = (float("inf"), None)   # (distance, replica)
+    trace = []
+
+    try:
+        for round_index in range(rounds):
+            # Sweep: send all requests first so the workers run
+            # concurrently, then collect the replies
+            if processes:
+                for w, (_, conn) in enumerate(processes):
+                    conn.send(("run", {
+                        r: temperatures[rung_of[r]] for r in groups[w]
+                    }, steps_per_round))
+                replies = [conn.recv() for _, conn in processes]
+            else:
+                replies = [hosts[0](("run", {
+                    r: temperatures[rung_of[r]] for r in groups[0]
+                }, steps_per_round))]
+
+            for reply in replies:
+                for r, (current, replica_best) in reply.items():
+                    energy[r] = current
+                    if replica_best < best[0]:
+                        best = (replica_best, r)
+            trace.append((time.perf_counter() - started, best[0]))
+
+            if target is not None and best[0] <= target:
+                break
+
+            # Exchange: Metropolis criterion between neighbouring rungs
+            replica_on = sorted(range(replicas), key=rung_of.__getitem__)
+            for k in range(round_index % 2, replicas - 1, 2):
+                a, b = replica_on[k], replica_on[k + 1]
+                log_p = (
+                    (1 / temperatures[k] - 1 / temperatures[k + 1])
+                    * (energy[a] - energy[b])
+                )
+                if log_p >= 0 or exchange_rng.random() < math.exp(log_p):
+                    rung_of[a], rung_of[b] = rung_of[b], rung_of[a]
+
+        best_distance, best_tour = hosts[host_of[best[1]]](("best", best[1]))
+    except (EOFError, ConnectionError) as error:
+        for process, _ in processes:
+            if process.is_alive():
+                process.terminate()
+        raise RuntimeError("a parallel tempering worker died") from error
+    finally:
+        for process, conn in processes:
+            if process.is_alive():
+                try:
+                    conn.send(("stop",))
+                except OSError:
+                    process.terminate()
+            process.join()
+            conn.close()
+
+    return best_distance, best_tour, trace
+
+
+def time_to_target(cities, target, seed=None, pt_options=None,
+                   sa_options=None):
+    """
+    Wall time each method needs to reach a tour of length <= target on
+    the same instance: parallel tempering versus simulated_annealing
+    with the 'exponential' and 'linear' schedules.
+
+    For the single-chain schedules the time is interpolated from the
+    iteration at which the best-distance history first reaches the
+    target. None means the target was not reached.
+
+    Returns:
+    dict method -> seconds (or None)
+    """
+    report = {}
+    for cooling_type in ("exponential", "linear"):
+        started = time.perf_counter()
+        _, history = simulated_annealing(
+            cities, cooling_type, rng=random.Random(seed),
+            **(sa_options or {})
+        )
+        elapsed = time.perf_counter() - started
+        hit = next(
+            (it for it, d in zip(history.iterations(), history)
+             if d <= target),
+            None
+        )
+        report[cooling_type] = (
+            None if hit is None
+            else elapsed * (hit + 1) / (len(history) * history.interval)
+        )
+
+    _, _, trace = parallel_tempering(
+        cities, seed=seed, target=target, **(pt_options or {})
+    )
+    report["parallel_tempering"] = next(
+        (t for t, d in trace if d <= target), None
+    )
+    return report
+
+
+# ------------------------------------------------------------
+# PLOTTING
+# ------------------------------------------------------------
+def plot_convergence(histories):
+    """
+    Plots best-distance curves, one per (label, history) pair.
+    """
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(8, 5))
+    for label, history in histories:
+        plt.plot(history, label=label)
+    plt.xlabel("Iteration")
+    plt.ylabel("Best Tour Distance")
+    plt.title("Simulated Annealing – Cooling Schedule Comparison")
+    plt.legend()
+    plt.grid(True)
+    plt.show()
+
+
+# ------------------------------------------------------------
+# COMMAND LINE
+# ------------------------------------------------------------
+def main(argv=None):
+    """
+    Compares exponential and linear cooling on one instance (by default
+    35 random cities, seed 42) and plots both convergence curves.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Simulated annealing for the TSP: exponential vs "
+                    "linear cooling."
+    )
+    parser.add_argument("--cities", type=int, default=35,
+                        help="number of random cities")
+    parser.add_argument("--tsplib", default=None,
+                        help="TSPLIB .tsp instance instead of random "
+                             "cities")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=2500)
+    parser.add_argument("--T-initial", default=800,
+                        help="starting temperature, or 'auto'")
+    parser.add_argument("--neighbors", type=int, default=None,
+                        help="k-nearest candidate moves")
+    parser.add_argument("--polish", action="store_true",
+                        help="2-opt / Or-opt polish of the best tours")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="skip the convergence plot")
+    args = parser.parse_args(argv)
+
+    # Fix random seed for reproducibility
+    random.seed(args.seed)
+    T_initial = args.T_initial
+    if T_initial != "auto":
+        T_initial = float(T_initial)
+
+    if args.tsplib:
+        cities, _ = load_tsplib(args.tsplib)
+    else:
+        cities = generate_cities(args.cities)
+    options = {
+        "T_initial": T_initial,
+        "max_iterations": args.iterations,
+        "neighbors": args.neighbors,
+        "polish": args.polish,
+    }
+
+    # Run Simulated Annealing with Exponential Cooling
+    dist_exp, history_exp = simulated_annealing(
+        cities, cooling_type="exponential", **options
+    )
+
+    # Run Simulated Annealing with Linear Cooling
+    dist_lin, history_lin = simulated_annealing(
+        cities, cooling_type="linear", **options
+    )
+
+    # Comparison
+    improvement = dist_lin - dist_exp
+    improvement_percent = (improvement / dist_lin) * 100 if dist_lin != 0 else 0
+
+    print("\n================ FINAL COMPARISON ================")
+    print("Number of Cities:", len(cities))
+    print("Exponential Cooling Distance:", round(dist_exp, 2))
+    print("Linear Cooling Distance     :", round(dist_lin, 2))
+
+    if improvement > 0:
+        print(
+            f"Exponential cooling improved the tour by "
+            f"{round(improvement, 2)} units "
+            f"({round(improvement_percent, 2)}%)."
+        )
+    else:
+        print("Both cooling schedules produced similar results.")
+
+    if not args.no_plot:
+        plot_convergence([
+            ("Exponential Cooling", history_exp),
+            ("Linear Cooling", history_lin),
+        ])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,63 +1,790 @@
-# ============================================================
-# QUESTION 2: Strategic Tile Shatter Game (Dynamic Programming)
-#
-# Objective:
-# Given a sequence of tiles, each with a value, determine the
-# maximum points obtainable by shattering tiles in an optimal order.
-#
-# Algorithm Used:
-# Interval Dynamic Programming
-#
-# Time Complexity:
-# O(n³), where n is the number of tiles
-# ============================================================
-
-def maxPoints(nums):
-    """
-    Computes the maximum points obtainable by optimally
-    shattering the tiles using Interval Dynamic Programming.
-
-    nums : list of integers representing tile values
-    """
-
-    # Step 1: Add virtual boundary tiles with value 1
-    # This simplifies edge case handling
-    nums = [1] + nums + [1]
-    n = len(nums)
-
-    # Step 2: Initialize DP table
-    # dp[i][j] stores the maximum points obtainable
-    # by shattering tiles between index i and j (exclusive)
-    dp = [[0] * n for _ in range(n)]
-
-    # Step 3: Interval DP computation
-    # length represents the distance between left and right indices
-    for length in range(2, n):
-        for left in range(n - length):
-            right = left + length
-
-            # Try each tile k as the last tile to be shattered
-            for k in range(left + 1, right):
-                dp[left][right] = max(
-                    dp[left][right],
-                    nums[left] * nums[k] * nums[right]
-                    + dp[left][k]
-                    + dp[k][right]
-                )
-
-    # Final answer is stored for the full interval
-    return dp[0][n - 1]
-
-
-# -----------------------------
-# TEST CASES
-# -----------------------------
-if __name__ == "__main__":
-
-    # Example 1
-    tiles1 = [3, 1, 5, 8]
-    print("Example 1 Output:", maxPoints(tiles1))
-
-    # Example 2
-    tiles2 = [1, 5]
-    print("Example 2 Output:", maxPoints(tiles2))
+# ============================================================
+# QUESTION 2: Strategic Tile Shatter Game (Dynamic Programming)
+#
+# Objective:
+# Given a sequence of tiles, each with a value, determine the
+# maximum points obtainable by shattering tiles in an optimal order.
+#
+# Algorithm Used:
+# Interval Dynamic Programming
+#
+# Time Complexity:
+# O(n³), where n is the number of tiles
+# ============================================================
+
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+
+
+def maxPoints(nums):
+    """
+    Computes the maximum points obtainable by optimally
+    shattering the tiles using Interval Dynamic Programming.
+
+    nums : list of integers representing tile values
+    """
+
+    # Step 1: Add virtual boundary tiles with value 1
+    # This simplifies edge case handling
+    nums = [1] + nums + [1]
+    n = len(nums)
+
+    # Step 2: Initialize DP table
+    # dp[i][j] stores the maximum points obtainable
+    # by shattering tiles between index i and j (exclusive)
+    dp = [[0] * n for _ in range(n)]
+
+    # Step 3: Interval DP computation
+    # length represents the distance between left and right indices
+    for length in range(2, n):
+        for left in range(n - length):
+            right = left + length
+
+            # Try each tile k as the last tile to be shattered
+            for k in range(left + 1, right):
+                dp[left][right] = max(
+                    dp[left][right],
+                    nums[left] * nums[k] * nums[right]
+                    + dp[left][k]
+                    + dp[k][right]
+                )
+
+    # Final answer is stored for the full interval
+    return dp[0][n - 1]
+
+
+# -----------------------------
+# VECTORIZED ENGINE (NUMPY)
+# -----------------------------
+# Largest DP value handled in int64; above it Python ints are used.
+INT64_SAFE_LIMIT = 2 ** 62
+
+# Scores evaluated per block (interval rows x splits), sized to stay in
+# the CPU cache while the four passes over it run.
+BLOCK_ELEMENTS = 1 << 15
+# Intervals per block in the triangular engine
+BLOCK_WIDTH = 4096
+
+
+def _dp_dtype(nums):
+    """
+    Smallest exact NumPy dtype for the DP table of the padded tiles.
+    Every shattered tile adds at most max|v|³, so n * max|v|³ bounds
+    every entry.
+    """
+    if all(isinstance(v, (int, np.integer)) for v in nums):
+        bound = max(abs(int(v)) for v in nums) ** 3 * len(nums)
+        return np.int64 if bound < INT64_SAFE_LIMIT else object
+    # Padding tiles are int 1; float64 only reproduces maxPoints when
+    # every real tile is a float (mixed int/float stays in Python)
+    if all(isinstance(v, (float, np.floating)) for v in nums[1:-1]):
+        return np.float64
+    return object
+
+
+def maxPoints_vectorized(nums, storage="full", return_order=False):
+    """
+    Same interval DP as maxPoints, one diagonal (interval length) at a
+    time: for all intervals of a length, every split k is evaluated
+    with whole-array operations instead of the inner Python loops.
+
+    storage:
+    - 'full'       : dp and its transpose as two (n, n) tables; all
+                     operands are strided views (fastest)
+    - 'triangular' : only the upper triangle, folded into one flat
+                     array of about n² / 2 entries (see
+                     triangular_address); 4x less memory
+
+    Results are identical to maxPoints: int64 while n * max|v|³ fits,
+    Python ints beyond that, float64 for float tiles (evaluated in the
+    same order as maxPoints, so rounding matches too).
+
+    nums         : list of tile values
+    return_order : also record the best split of every interval (in an
+                   int16 / int32 table laid out like dp) and return an
+                   optimal shatter order
+
+    Returns:
+    maximum points (int or float, like maxPoints)[, order]
+    order lists 0-based tile indices in the order they are shattered
+    """
+    nums = [1] + list(nums) + [1]
+    n = len(nums)
+    dtype = _dp_dtype(nums)
+    values = np.array(nums, dtype=dtype)
+
+    split = None
+    if return_order:
+        split = np.zeros(_table_shapes(n, storage)[0], dtype=_split_dtype(n))
+    if storage == "full":
+        result = _fill_full(values, n, dtype, split)
+    elif storage == "triangular":
+        result = _fill_triangular(values, n, dtype, split)
+    else:
+        raise ValueError(f"unknown storage {storage!r}")
+    if return_order:
+        return _as_result(result), shatter_order(split, n, storage)
+    return _as_result(result)
+
+
+def _as_result(result):
+    if result == 0:
+        return 0    # maxPoints keeps its int 0 when nothing scores
+    return result.item() if hasattr(result, "item") else result
+
+
+def _fill_full(values, n, dtype, split=None):
+    """
+    Two tables are kept, dp and its transpose dpT, so that both
+    dp[left][k] and dp[k][right] are read as contiguous rows (see
+    _full_step).
+    """
+    dp = np.zeros((n, n), dtype=dtype)
+    dpT = np.zeros((n, n), dtype=dtype)
+    work = np.empty(BLOCK_ELEMENTS + n, dtype=dtype)
+    for length in range(2, n):
+        _full_step(values, dp, dpT, length, 0, n - length, work, split)
+    return dp[0, n - 1]
+
+
+def _full_step(values, dp, dpT, length, lo, hi, work, split=None):
+    """
+    Fills dp[left][left + length] (and dpT) for intervals lo <= left
+    < hi. The (intervals x splits) operands are strided views:
+
+        dp[left][left + m]     = dp.flat [left * (n + 1) + m]
+        dp[left + m][left + L] = dpT.flat[L * n + left * (n + 1) + m]
+
+    for m = 1 .. L - 1, i.e. sliding windows over the flat buffers,
+    taken every n + 1 elements. No operand is copied.
+
+    split, if given, receives the best offset m = k - left (the first
+    one, as in maxPoints) at split[left][left + L].
+    """
+    n = len(values)
+    flat, flatT = dp.reshape(-1), dpT.reshape(-1)
+    stride = n + 1
+    splits = length - 1         # choices of k per interval
+    middle = sliding_window_view(values[1:], splits)
+    left_part = sliding_window_view(flat[1:], splits)[::stride]
+    right_part = sliding_window_view(flatT[length * n + 1:], splits)
+    right_part = right_part[::stride]
+    best = np.empty(hi - lo, dtype=dp.dtype)
+    if split is not None:
+        best_split = np.empty(hi - lo, dtype=np.intp)
+
+    # Rows in cache-sized blocks, same operation order as maxPoints
+    rows = max(1, BLOCK_ELEMENTS // splits)
+    for a in range(lo, hi, rows):
+        b = min(hi, a + rows)
+        scores = work[:(b - a) * splits].reshape(b - a, splits)
+        np.multiply(values[a:b, None], middle[a:b], out=scores)
+        scores *= values[a + length:b + length, None]
+        scores += left_part[a:b]
+        scores += right_part[a:b]
+        if split is None:
+            scores.max(axis=1, out=best[a - lo:b - lo])
+        else:
+            arg = scores.argmax(axis=1)
+            best_split[a - lo:b - lo] = arg + 1
+            best[a - lo:b - lo] = scores[np.arange(b - a), arg]
+
+    # maxPoints starts every entry at 0 before maximizing
+    np.maximum(best, 0, out=best)
+    flat[length + lo * stride::stride][:hi - lo] = best   # dp[l][l + L]
+    flatT[length * n + lo * stride::stride][:hi - lo] = best
+    if split is not None:
+        split.reshape(-1)[length + lo * stride::stride][:hi - lo] = best_split
+
+
+def triangular_address(d, left, n):
+    """
+    Position of dp[left][left + d] in the folded triangular table.
+
+    Diagonal d (n - d intervals) and diagonal n - d (d intervals) share
+    one row of n slots, so (n // 2 + 1) * n slots hold the whole upper
+    triangle (row 0 is unused):
+
+        d <= n // 2 : row d,     column left
+        d >  n // 2 : row n - d, column d + left
+
+    Both forms are linear in d, which keeps every DP operand a strided
+    view of the flat table.
+    """
+    if d <= n // 2:
+        return d * n + left
+    return n * n - d * (n - 1) + left
+
+
+def _strided(flat, start, step, rows, cols):
+    """
+    (rows, cols) view with element [r, c] = flat[start + r * step + c].
+    """
+    size = flat.itemsize
+    if step >= 0:
+        return as_strided(flat[start:], (rows, cols), (step * size, size))
+    low = start + step * (rows - 1)
+    view = as_strided(flat[low:], (rows, cols), (-step * size, size))
+    return view[::-1]
+
+
+def _fill_triangular(values, n, dtype, split=None):
+    """
+    One flat table in the folded layout of triangular_address (see
+    _triangular_step).
+    """
+    table = np.zeros((n // 2 + 1) * n, dtype=dtype)
+    work = np.empty(BLOCK_ELEMENTS + n, dtype=dtype)
+    for length in range(2, n):
+        _triangular_step(values, table, length, 0, n - length, work,
+                         split)
+    return table[triangular_address(n - 1, 0, n)]
+
+
+def _triangular_step(values, table, length, lo, hi, work, split=None):
+    """
+    Fills dp[left][left + length] for intervals lo <= left < hi in the
+    folded table. Along the split offset m, dp[left][left + m] and
+    dp[left + m][left + L] change layout branch at most once each (at
+    m = n // 2 + 1 and m = L - n // 2), so the splits fall into at
+    most three segments in which both operands are (splits x
+    intervals) strided views. The best score per interval is a running
+    maximum over those blocks.
+
+    split, if given, is a table in the same layout that receives the
+    best offset m = k - left per interval.
+    """
+    n = len(values)
+    half = n // 2
+    start = triangular_address(length, 0, n)
+    # maxPoints starts every entry at 0 before maximizing (the table
+    # is zero-initialized)
+    best = table[start:start + (n - length)]
+
+    cuts = sorted({1, length, half + 1, length - half})
+    segments = [(a, b) for a, b in zip(cuts, cuts[1:])
+                if 1 <= a < b <= length]
+
+    for col_lo in range(lo, hi, BLOCK_WIDTH):
+        col_hi = min(hi, col_lo + BLOCK_WIDTH)
+        cols = col_hi - col_lo
+        outer_left = values[col_lo:col_hi]
+        outer_right = values[col_lo + length:col_hi + length]
+        # middle_rows[r, c] = values[r + c]
+        middle_rows = sliding_window_view(values, cols)
+        rows_per_block = max(1, BLOCK_ELEMENTS // cols)
+        target = best[col_lo:col_hi]
+        if split is not None:
+            split_target = split[start + col_lo:start + col_hi]
+
+        for m0, m1 in segments:
+            for a in range(m0, m1, rows_per_block):
+                b = min(m1, a + rows_per_block)
+                rows = b - a
+                left_step = n if a <= half else 1 - n
+                right_step = 1 - n if length - a <= half else n
+                left_part = _strided(
+                    table, triangular_address(a, col_lo, n),
+                    left_step, rows, cols)
+                right_part = _strided(
+                    table, triangular_address(length - a, col_lo + a, n),
+                    right_step, rows, cols)
+
+                # Same operation order as maxPoints
+                scores = work[:rows * cols].reshape(rows, cols)
+                np.multiply(outer_left, middle_rows[col_lo + a:col_lo + b],
+                            out=scores)
+                scores *= outer_right
+                scores += left_part
+                scores += right_part
+                if split is None:
+                    np.maximum(target, scores.max(axis=0), out=target)
+                    continue
+                # Keep the first best split: only strictly better
+                # blocks (or a still-unset split) replace it
+                arg = scores.argmax(axis=0)
+                block_best = scores[arg, np.arange(cols)]
+                better = (block_best > target) | (split_target == 0)
+                split_target[better] = arg[better] + a
+                np.maximum(target, block_best, out=target)
+
+
+# -----------------------------
+# SHATTER ORDER RECONSTRUCTION
+# -----------------------------
+def _split_dtype(n):
+    """Split offsets are < n: int16 up to 32767 tiles, else int32."""
+    return np.int16 if n <= np.iinfo(np.int16).max else np.int32
+
+
+def shatter_order(split, n, storage="full"):
+    """
+    Rebuilds an optimal shatter order from a split table filled by
+    maxPoints_vectorized / maxPoints_parallel (n = tiles + 2).
+
+    split[left][right] holds the offset of the tile shattered last in
+    the open interval (left, right). Intervals are expanded with an
+    explicit stack (no recursion), each one exactly once, so the order
+    is built in O(n): every tile is emitted before the tiles shattered
+    earlier than it, and the list is reversed at the end.
+
+    For non-negative tiles the order scores exactly the DP maximum
+    (see shatter_score).
+
+    Returns:
+    list of 0-based tile indices, first shattered first
+    """
+    if storage == "full":
+        def offset(left, right):
+            return split[left, right]
+    else:
+        flat = split.reshape(-1)
+
+        def offset(left, right):
+            return flat[triangular_address(right - left, left, n)]
+
+    order = []
+    stack = [(0, n - 1)]
+    while stack:
+        left, right = stack.pop()
+        if right - left < 2:
+            continue
+        k = left + int(offset(left, right))
+        order.append(k - 1)         # tile index without the padding
+        stack.append((left, k))
+        stack.append((k, right))
+    order.reverse()
+    return order
+
+
+def shatter_score(nums, order):
+    """
+    Points scored by shattering the tiles in the given order (each tile
+    scores left * tile * right with its current neighbours, 1 past the
+    ends). Neighbours are kept in linked arrays, so this is O(n).
+    """
+    values = [1] + list(nums) + [1]
+    prev = list(range(-1, len(values) - 1))
+    nxt = list(range(1, len(values) + 1))
+    points = 0
+    for tile in order:
+        i = tile + 1
+        points += values[prev[i]] * values[i] * values[nxt[i]]
+        nxt[prev[i]] = nxt[i]
+        prev[nxt[i]] = prev[i]
+    return points
+
+
+# -----------------------------
+# PARALLEL WAVEFRONT (SHARED MEMORY)
+# -----------------------------
+# All intervals of one length depend only on shorter ones, so each
+# diagonal is split into contiguous slices, one per worker, and a
+# barrier separates consecutive lengths. The DP table lives in shared
+# memory; workers are started once and keep running for all lengths.
+
+# Below this many tiles process start-up costs more than it saves.
+PARALLEL_MIN_TILES = 200
+
+
+def _table_shapes(n, storage):
+    if storage == "full":
+        return [(n, n), (n, n)]           # dp, dpT
+    if storage == "triangular":
+        return [((n // 2 + 1) * n,)]
+    raise ValueError(f"unknown storage {storage!r}")
+
+
+def _wavefront(values, tables, storage, rank, workers, barrier,
+               split=None):
+    """
+    Runs every diagonal of the DP on this worker's slice of intervals,
+    waiting at the barrier after each length.
+    """
+    n = len(values)
+    work = np.empty(BLOCK_ELEMENTS + n, dtype=values.dtype)
+    try:
+        for length in range(2, n):
+            count = n - length
+            lo = rank * count // workers
+            hi = (rank + 1) * count // workers
+            if lo < hi:
+                if storage == "full":
+                    _full_step(values, tables[0], tables[1], length,
+                               lo, hi, work, split)
+                else:
+                    _triangular_step(values, tables[0], length, lo, hi,
+                                     work, split)
+            barrier.wait()
+    except BaseException:
+        # Release the other workers instead of leaving them waiting
+        barrier.abort()
+        raise
+
+
+def _attach(specs, blocks):
+    return [
+        np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        for (shape, dtype), block in zip(specs, blocks)
+    ]
+
+
+def _wavefront_worker(names, specs, values, storage, rank, workers,
+                      barrier, with_split):
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        tables = _attach(specs, blocks)
+        split = tables.pop() if with_split else None
+        _wavefront(values, tables, storage, rank, workers, barrier, split)
+    finally:
+        split = None
+        tables = None
+        for block in blocks:
+            block.close()
+
+
+def maxPoints_parallel(nums, workers=None, storage="full",
+                       return_order=False):
+    """
+    maxPoints_vectorized with every diagonal split across worker
+    processes over a shared-memory DP table.
+
+    workers      : process count including the caller (None = CPU
+                   count, 1 = serial maxPoints_vectorized)
+    storage      : 'full' or 'triangular', as in maxPoints_vectorized
+    return_order : also return an optimal shatter order (the split
+                   table is shared like the DP table)
+
+    Values needing Python ints (object dtype) cannot live in shared
+    memory; such inputs, and games under PARALLEL_MIN_TILES tiles, are
+    solved serially.
+
+    Returns:
+    maximum points (identical to maxPoints)[, order]
+    """
+    shapes = _table_shapes(len(nums) + 2, storage)
+    padded = [1] + list(nums) + [1]
+    n = len(padded)
+    dtype = _dp_dtype(padded)
+    workers = min(workers or os.cpu_count() or 1, n - 2)
+    if workers <= 1 or dtype is object or n - 2 < PARALLEL_MIN_TILES:
+        return maxPoints_vectorized(nums, storage, return_order)
+
+    values = np.array(padded, dtype=dtype)
+    specs = [(shape, values.dtype) for shape in shapes]
+    if return_order:
+        specs.append((shapes[0], np.dtype(_split_dtype(n))))
+    blocks = [
+        shared_memory.SharedMemory(
+            create=True, size=int(np.prod(shape)) * spec_dtype.itemsize
+        )
+        for shape, spec_dtype in specs
+    ]
+    tables = split = None
+    processes = []
+    try:
+        tables = _attach(specs, blocks)
+        for table in tables:
+            table[...] = 0
+        split = tables.pop() if return_order else None
+
+        barrier = multiprocessing.Barrier(workers)
+        names = [block.name for block in blocks]
+        processes = [
+            multiprocessing.Process(
+                target=_wavefront_worker,
+                args=(names, specs, values, storage, rank, workers,
+                      barrier, return_order),
+                daemon=True,
+            )
+            for rank in range(1, workers)
+        ]
+        for process in processes:
+            process.start()
+
+        # The caller works as rank 0
+        try:
+            _wavefront(values, tables, storage, 0, workers, barrier,
+                       split)
+        except threading.BrokenBarrierError:
+            raise RuntimeError("a wavefront worker failed") from None
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("a wavefront worker failed")
+
+        if storage == "full":
+            result = tables[0][0, n - 1]
+        else:
+            result = tables[0][triangular_address(n - 1, 0, n)]
+        if return_order:
+            return _as_result(result), shatter_order(split, n, storage)
+        return _as_result(result)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        tables = split = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def benchmark_wavefront(n=1500, workers=(1, 2, 4), storage="full",
+                        repeats=3, seed=0):
+    """
+    Times maxPoints_parallel on n random tiles for each worker count
+    against the serial maxPoints_vectorized (best of `repeats` runs).
+
+    Returns:
+    list of {"workers", "seconds", "speedup"} records; the serial run
+    is recorded with workers = 1
+    """
+    rng = random.Random(seed)
+    tiles = [rng.randint(0, 100) for _ in range(n)]
+
+    def best_time(solve):
+        times = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            result = solve()
+            times.append(time.perf_counter() - started)
+        return min(times), result
+
+    serial, expected = best_time(
+        lambda: maxPoints_vectorized(tiles, storage)
+    )
+    records = [{"workers": 1, "seconds": serial, "speedup": 1.0}]
+    for count in workers:
+        if count == 1:
+            continue
+        seconds, result = best_time(
+            lambda: maxPoints_parallel(tiles, count, storage)
+        )
+        if result != expected:
+            raise AssertionError(
+                f"parallel result {result} != serial {expected}"
+            )
+        records.append({
+            "workers": count,
+            "seconds": seconds,
+            "speedup": serial / seconds,
+        })
+    return records
+
+
+# -----------------------------
+# BATCH API (LRU CACHE + PROCESS POOL)
+# -----------------------------
+# Up to this many tiles the plain loops beat NumPy's per-call overhead.
+VECTORIZE_MIN_TILES = 30
+
+
+def score_tiles(tiles):
+    """maxPoints with the faster engine for the sequence length."""
+    if len(tiles) < VECTORIZE_MIN_TILES:
+        return maxPoints(list(tiles))
+    return maxPoints_vectorized(tiles)
+
+
+class ScoreCache:
+    """
+    Bounded LRU cache of maxPoints results keyed on the tile tuple
+    together with the type of every tile.
+
+    hits / misses count lookups; the least recently used entry is
+    evicted once `capacity` entries are stored.
+    """
+
+    def __init__(self, capacity=4096):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached score for key (marked as recently used) or None."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, score):
+        self._entries[key] = score
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def stats(self):
+        """Counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+# Shared by maxPoints_batch calls that do not pass their own cache
+SCORE_CACHE = ScoreCache()
+
+
+def maxPoints_batch(sequences, cache=None, workers=1, pool=None,
+                    chunksize=16):
+    """
+    Scores many tile sequences at once.
+
+    Every distinct sequence (as a tuple, with its element types, since
+    (1, 2) == (1.0, 2.0) but they score as int and float) is looked up
+    once in the LRU cache; repeats within the batch reuse that lookup or computation.
+    The remaining misses are solved once each, across a process pool
+    when there are several, and stored in the cache.
+
+    Parameters:
+    sequences : iterable of tile lists
+    cache     : ScoreCache (default: the module-wide SCORE_CACHE)
+    workers   : processes for the misses (1 = in this process, None =
+                CPU count); ignored when pool is given
+    pool      : an existing executor to reuse across batches, which
+                saves the process start-up on every call
+    chunksize : sequences per pool task
+
+    Returns:
+    list of scores, in input order
+    """
+    if cache is None:
+        cache = SCORE_CACHE
+    keys = []
+    for tiles in sequences:
+        tiles = tuple(tiles)
+        keys.append((tiles, tuple(map(type, tiles))))
+
+    scores = {}
+    missing = []
+    for key in keys:
+        if key in scores:
+            continue
+        score = cache.get(key)
+        if score is None:
+            missing.append(key)
+        scores[key] = score
+
+    if missing:
+        tiles = [key[0] for key in missing]
+        if pool is not None:
+            solved = pool.map(score_tiles, tiles, chunksize=chunksize)
+        elif workers == 1 or len(missing) == 1:
+            solved = map(score_tiles, tiles)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                solved = list(executor.map(score_tiles, tiles,
+                                           chunksize=chunksize))
+        for key, score in zip(missing, solved):
+            scores[key] = score
+            cache.put(key, score)
+
+    return [scores[key] for key in keys]
+
+
+# -----------------------------
+# TEST CASES
+# -----------------------------
+def run_examples():
+    """Runs the two examples from the question."""
+
+    # Example 1
+    tiles1 = [3, 1, 5, 8]
+    print("Example 1 Output:", maxPoints(tiles1))
+
+    # Example 2
+    tiles2 = [1, 5]
+    print("Example 2 Output:", maxPoints(tiles2))
+
+
+# -----------------------------
+# COMMAND LINE
+# -----------------------------
+def main(argv=None):
+    """
+    Prints the maximum points for the tile values given on the command
+    line, or runs the examples when none are given.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Strategic tile shatter game (interval DP)."
+    )
+    parser.add_argument("tiles", nargs="*", type=int,
+                        help="tile values, e.g. 3 1 5 8")
+    parser.add_argument("--engine", choices=["python", "numpy"],
+                        default="numpy",
+                        help="pure-Python loops or the vectorized DP")
+    parser.add_argument("--storage", choices=["full", "triangular"],
+                        default="full",
+                        help="DP table layout of the numpy engine")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for the numpy engine (0 = all "
+                             "CPUs)")
+    parser.add_argument("--order", action="store_true",
+                        help="also print an optimal shatter order "
+                             "(numpy engine)")
+    parser.add_argument("--benchmark", type=int, default=None,
+                        metavar="N",
+                        help="time 1..--workers processes on N random "
+                             "tiles")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        top = args.workers or os.cpu_count() or 1
+        counts = sorted({1, *(2 ** i for i in range(top.bit_length())),
+                         top})
+        for record in benchmark_wavefront(args.benchmark, counts,
+                                          args.storage):
+            print(f"workers={record['workers']:>3}  "
+                  f"{record['seconds']:8.3f}s  "
+                  f"speedup={record['speedup']:.2f}x")
+        return
+    if not args.tiles:
+        run_examples()
+        return
+    if args.engine == "python":
+        print("Output:", maxPoints(args.tiles))
+    elif args.order:
+        points, order = maxPoints_parallel(
+            args.tiles, args.workers or None, args.storage, return_order=True
+        )
+        print("Output:", points)
+        print("Order :", " ".join(str(args.tiles[i]) for i in order))
+    else:
+        print("Output:", maxPoints_parallel(args.tiles, args.workers or None,
+                                            args.storage))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,122 +1,1006 @@
-# ============================================================
-# QUESTION 3: Service Center Placement in a Binary Tree
-#
-# Objective:
-# Place the MINIMUM number of service centers so that
-# every city (node) in the binary tree is covered.
-#
-# Coverage Rule:
-# A service center placed at a node covers:
-# - The node itself
-# - Its parent
-# - Its immediate children
-#
-# Algorithm:
-# Greedy strategy using POST-ORDER DFS
-#
-# Time Complexity:
-# O(n), where n is the number of nodes
-# ============================================================
-
-
-from collections import deque
-
-
-class TreeNode:
-    """Represents a node (city) in the binary tree."""
-    def __init__(self, val=0):
-        self.val = val
-        self.left = None
-        self.right = None
-
-
-def build_tree(level_order):
-    """
-    Builds a binary tree from a level-order list.
-    None represents missing nodes.
-
-    Example:
-    [0, 0, None, 0, None, 0, None, None, 0]
-    """
-
-    if not level_order or level_order[0] is None:
-        return None
-
-    root = TreeNode(level_order[0])
-    queue = deque([root])
-    i = 1
-
-    while queue and i < len(level_order):
-        current = queue.popleft()
-
-        # Left child
-        if i < len(level_order) and level_order[i] is not None:
-            current.left = TreeNode(level_order[i])
-            queue.append(current.left)
-        i += 1
-
-        # Right child
-        if i < len(level_order) and level_order[i] is not None:
-            current.right = TreeNode(level_order[i])
-            queue.append(current.right)
-        i += 1
-
-    return root
-
-
-class Solution:
-    """Computes minimum number of service centers."""
-    def __init__(self):
-        self.centers = 0
-
-    def minServiceCenters(self, root):
-
-        # DFS states:
-        # 0 → needs coverage
-        # 1 → covered
-        # 2 → has service center
-
-        def dfs(node):
-            if not node:
-                return 1  # null nodes are treated as covered
-
-            left = dfs(node.left)
-            right = dfs(node.right)
-
-            # If any child needs coverage, place service center here
-            if left == 0 or right == 0:
-                self.centers += 1
-                return 2
-
-            # If any child has a service center, this node is covered
-            if left == 2 or right == 2:
-                return 1
-
-            # Otherwise, this node needs coverage
-            return 0
-
-        root_state = dfs(root)
-
-        # Final check for root
-        if root_state == 0:
-            self.centers += 1
-
-        return self.centers
-
-
-# -----------------------------
-# TEST CASE (FROM QUESTION)
-# -----------------------------
-if __name__ == "__main__":
-
-    # Input (level-order):
-    # {0, 0, null, 0, null, 0, null, null, 0}
-    tree_input = [0, 0, None, 0, None, 0, None, None, 0]
-
-    root = build_tree(tree_input)
-
-    solution = Solution()
-    print(
-        "Minimum service centers required:",
-        solution.minServiceCenters(root)
-    )
+# ============================================================
+# QUESTION 3: Service Center Placement in a Binary Tree
+#
+# Objective:
+# Place the MINIMUM number of service centers so that
+# every city (node) in the binary tree is covered.
+#
+# Coverage Rule:
+# A service center placed at a node covers:
+# - The node itself
+# - Its parent
+# - Its immediate children
+#
+# Algorithm:
+# Greedy strategy using POST-ORDER DFS
+#
+# Time Complexity:
+# O(n), where n is the number of nodes
+# ============================================================
+
+
+import os
+import random
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+class TreeNode:
+    """Represents a node (city) in the binary tree."""
+    def __init__(self, val=0):
+        self.val = val
+        self.left = None
+        self.right = None
+
+
+def build_tree(level_order):
+    """
+    Builds a binary tree from a level-order list.
+    None represents missing nodes.
+
+    Example:
+    [0, 0, None, 0, None, 0, None, None, 0]
+    """
+
+    if not level_order or level_order[0] is None:
+        return None
+
+    root = TreeNode(level_order[0])
+    queue = deque([root])
+    i = 1
+
+    while queue and i < len(level_order):
+        current = queue.popleft()
+
+        # Left child
+        if i < len(level_order) and level_order[i] is not None:
+            current.left = TreeNode(level_order[i])
+            queue.append(current.left)
+        i += 1
+
+        # Right child
+        if i < len(level_order) and level_order[i] is not None:
+            current.right = TreeNode(level_order[i])
+            queue.append(current.right)
+        i += 1
+
+    return root
+
+
+class Solution:
+    """Computes minimum number of service centers."""
+    def __init__(self):
+        self.centers = 0
+
+    def minServiceCenters(self, root):
+
+        # Start from zero, so a reused Solution does not accumulate
+        self.centers = 0
+
+        # DFS states:
+        # 0 → needs coverage
+        # 1 → covered
+        # 2 → has service center
+
+        def dfs(node):
+            if not node:
+                return 1  # null nodes are treated as covered
+
+            left = dfs(node.left)
+            right = dfs(node.right)
+
+            # If any child needs coverage, place service center here
+            if left == 0 or right == 0:
+                self.centers += 1
+                return 2
+
+            # If any child has a service center, this node is covered
+            if left == 2 or right == 2:
+                return 1
+
+            # Otherwise, this node needs coverage
+            return 0
+
+        root_state = dfs(root)
+
+        # Final check for root
+        if root_state == 0:
+            self.centers += 1
+
+        return self.centers
+
+
+# -----------------------------
+# ITERATIVE SOLVER (NO RECURSION)
+# -----------------------------
+# What a node reports to its parent (one byte per node):
+NEEDS_COVER = 1     # state 0: not covered
+HAS_CENTER = 2      # state 2: service center placed here
+COVERED = 0         # state 1: covered by a child
+# Report of a node, indexed by the OR of its children's reports (a
+# leaf has none, i.e. 0): a child needing cover forces a center, a
+# child center covers the node, otherwise it needs cover itself.
+_REPORT = bytes([NEEDS_COVER, HAS_CENTER, COVERED, HAS_CENTER])
+
+
+def min_service_centers(root):
+    """
+    Same greedy as Solution.minServiceCenters, without recursion.
+
+    1. Nodes are listed in level order, recording only each node's
+       child count (a bytearray). The children of consecutive nodes
+       are consecutive in that list.
+    2. Nodes are visited in reverse level order, so every child is
+       final before its parent, with a pointer walking the child
+       blocks backwards. Each node combines its children's reports
+       (another bytearray) into its own.
+
+    Works for chains of any depth in O(n) time, with two bytes of state
+    per node besides the node list.
+
+    Returns:
+    minimum number of service centers
+    """
+    if root is None:
+        return 0
+
+    nodes = [root]
+    append = nodes.append
+    child_count = bytearray()
+    for node in nodes:          # the list grows while it is walked
+        count = 0
+        if node.left:
+            append(node.left)
+            count = 1
+        if node.right:
+            append(node.right)
+            count += 1
+        child_count.append(count)
+
+    report = bytearray(len(nodes))
+    centers = 0
+    block = len(nodes)          # start of the children of node i
+    for i in range(len(nodes) - 1, -1, -1):
+        count = child_count[i]
+        if count == 0:
+            report[i] = NEEDS_COVER
+            continue
+        block -= count
+        children = report[block]
+        if count == 2:
+            children |= report[block + 1]
+        report[i] = _REPORT[children]
+        centers += children & NEEDS_COVER
+
+    # An uncovered root takes a center itself
+    return centers + (report[0] == NEEDS_COVER)
+
+
+# -----------------------------
+# ARRAY-BACKED TREE
+# -----------------------------
+class ArrayTree:
+    """
+    Binary tree as parallel integer arrays instead of TreeNode objects.
+
+    Nodes are numbered in level order (0 = root), the order build_tree
+    creates them in, so parent[i] < i and the children of consecutive
+    nodes are consecutive. left[i] / right[i] / parent[i] hold node
+    numbers, or -1 where there is none: 12 bytes per node with int32.
+    """
+
+    def __init__(self, left, right, parent):
+        self.left = left
+        self.right = right
+        self.parent = parent
+
+    def __len__(self):
+        return len(self.left)
+
+    @classmethod
+    def from_level_order(cls, level_order, sentinel=None):
+        """
+        Builds the tree build_tree would build, without creating nodes.
+
+        level_order : list with None for missing nodes, or a NumPy
+                      array in which `sentinel` (e.g. -1 or NaN) marks
+                      missing nodes
+
+        In build_tree, the j-th created node (node j) takes entries
+        1 + 2j (left) and 2 + 2j (right), and the build stops once no
+        created node is left to take the next entry. Both rules are
+        evaluated on whole arrays.
+        """
+        if isinstance(level_order, np.ndarray):
+            if sentinel is not None and sentinel != sentinel:   # NaN
+                present = ~np.isnan(level_order)
+            else:
+                present = level_order != sentinel
+        else:
+            present = np.fromiter(
+                (v is not None for v in level_order), dtype=bool,
+                count=len(level_order),
+            )
+        if len(present) == 0 or not present[0]:
+            empty = np.empty(0, dtype=np.int32)
+            return cls(empty, empty.copy(), empty.copy())
+
+        # Entry p >= 1 is read only while node (p - 1) // 2 exists,
+        # i.e. was created from entries 0 .. p - 1
+        created = np.cumsum(present)
+        p = np.arange(1, len(present))
+        starved = np.flatnonzero((p - 1) // 2 >= created[:-1])
+        if len(starved):
+            present = present[:starved[0] + 1]
+            created = created[:starved[0] + 1]
+
+        n = int(created[-1])
+        dtype = np.int32 if n < 2 ** 31 else np.int64
+        positions = np.flatnonzero(present[1:]) + 1
+        ids = (created[positions] - 1).astype(dtype)
+        parents = ((positions - 1) // 2).astype(dtype)
+        is_left = (positions - 1) % 2 == 0
+
+        left = np.full(n, -1, dtype=dtype)
+        right = np.full(n, -1, dtype=dtype)
+        parent = np.full(n, -1, dtype=dtype)
+        left[parents[is_left]] = ids[is_left]
+        right[parents[~is_left]] = ids[~is_left]
+        parent[ids] = parents
+        return cls(left, right, parent)
+
+    @classmethod
+    def from_stream(cls, tokens):
+        """
+        Builds the tree build_tree would build from an iterable of
+        level-order values (None = missing node), e.g. a generator or
+        read_level_order(path), without holding the input in memory.
+
+        Because nodes are numbered in level order, build_tree's queue
+        is the id range parent .. n - 1: the node taking the next entry
+        and the number of nodes created so far. Memory is the growing
+        left / right / parent arrays (array('i'), 12 bytes per node)
+        and nothing else. Like build_tree, it stops reading once no
+        node is left to take the next entry.
+        """
+        left, right, parent = array("i"), array("i"), array("i")
+        tokens = iter(tokens)
+        if next(tokens, None) is not None:
+            left.append(-1)
+            right.append(-1)
+            parent.append(-1)
+            n, current, links = 1, 0, left
+            for value in tokens:
+                if value is not None:
+                    links[current] = n
+                    left.append(-1)
+                    right.append(-1)
+                    parent.append(current)
+                    n += 1
+                if links is left:
+                    links = right
+                else:
+                    links = left
+                    current += 1
+                    if current == n:
+                        break
+
+        # Zero-copy views of the finished arrays
+        return cls(*(np.frombuffer(a, dtype=np.int32) if len(a)
+                     else np.empty(0, dtype=np.int32)
+                     for a in (left, right, parent)))
+
+    def level_bounds(self):
+        """
+        Level boundaries: level d is nodes bounds[d] .. bounds[d + 1] - 1.
+        The next level starts right after the current one and holds all
+        children of its nodes.
+        """
+        n = len(self)
+        if n == 0:
+            return [0]
+        # children[i]: children of nodes 0 .. i (8 bytes per node, read
+        # one Python int at a time)
+        children = memoryview(np.cumsum(
+            (self.left >= 0).astype(np.int64) + (self.right >= 0)
+        ))
+        bounds = [0, 1]
+        while bounds[-1] < n:
+            bounds.append(1 + children[bounds[-1] - 1])
+        return bounds
+
+
+# Levels narrower than this are solved node by node: a NumPy call
+# per level would cost more than the loop (e.g. on chains).
+VECTOR_LEVEL_MIN = 64
+
+
+def min_service_centers_array(tree):
+    """
+    min_service_centers on an ArrayTree, bottom-up one level at a time.
+
+    Reports (see _REPORT) live in a bytearray with one spare slot at
+    the end, so child -1 reads the spare slot, a neutral 0. Wide levels
+    are combined with NumPy through a view of that bytearray; runs of
+    narrow levels (contiguous node ranges) are combined in a plain loop
+    over the same bytes.
+
+    Returns:
+    minimum number of service centers
+    """
+    n = len(tree)
+    if n == 0:
+        return 0
+    report = bytearray(n + 1)
+    view = np.frombuffer(report, dtype=np.uint8)
+    table = np.frombuffer(_REPORT, dtype=np.uint8)
+    bounds = tree.level_bounds()
+
+    centers = 0
+    level = len(bounds) - 2
+    while level >= 0:
+        lo, hi = bounds[level], bounds[level + 1]
+        if hi - lo >= VECTOR_LEVEL_MIN:
+            children = view[tree.left[lo:hi]] | view[tree.right[lo:hi]]
+            view[lo:hi] = table[children]
+            centers += int(np.count_nonzero(children & NEEDS_COVER))
+            level -= 1
+            continue
+
+        # Merge this and the narrow levels above it into one range
+        while (level > 0
+               and bounds[level] - bounds[level - 1] < VECTOR_LEVEL_MIN):
+            level -= 1
+        lo = bounds[level]
+        level -= 1
+        for i, left, right in zip(range(hi - 1, lo - 1, -1),
+                                  reversed(memoryview(tree.left[lo:hi])),
+                                  reversed(memoryview(tree.right[lo:hi]))):
+            children = report[left] | report[right]
+            report[i] = _REPORT[children]
+            centers += children & NEEDS_COVER
+
+    return centers + (report[0] == NEEDS_COVER)
+
+
+# -----------------------------
+# LEVEL-ORDER FILES (STREAMED)
+# -----------------------------
+READ_CHUNK = 1 << 20
+
+
+def read_level_order(path, null="null", binary=False, dtype="<i4",
+                     chunk=READ_CHUNK):
+    """
+    Yields the level-order values stored in a file, one at a time,
+    reading `chunk` bytes (text) or values (binary) at once.
+
+    Text files hold values separated by whitespace or commas, with
+    `null` (any case, or 'none') for missing nodes. Binary files hold
+    fixed-size `dtype` values, with the value `null` for missing nodes.
+
+    Returns:
+    generator of ints, None for missing nodes
+    """
+    if binary:
+        with open(path, "rb") as file:
+            while True:
+                block = np.fromfile(file, dtype=dtype, count=chunk)
+                if len(block) == 0:
+                    return
+                missing = block == null
+                for value, absent in zip(block.tolist(), missing.tolist()):
+                    yield None if absent else value
+
+    nulls = {str(null).lower(), "none"}
+    with open(path) as file:
+        rest = ""
+        while True:
+            text = file.read(chunk)
+            if not text:
+                break
+            # A token cut at the chunk end is finished by the next chunk
+            tokens = (rest + text).replace(",", " ").split()
+            rest = "" if text[-1].isspace() or text[-1] == "," \
+                else tokens.pop()
+            for token in tokens:
+                yield None if token.lower() in nulls else int(token)
+        if rest:
+            yield None if rest.lower() in nulls else int(rest)
+
+
+# -----------------------------
+# FORESTS OF GENERAL TREES (PARENT ARRAYS)
+# -----------------------------
+# The greedy works unchanged for any number of children: a node's
+# report is _REPORT of the OR of all its children's reports.
+
+# Components are packed into pool tasks of at least this many nodes
+FOREST_CHUNK_MIN = 1 << 14
+
+
+def forest_structure(parent):
+    """
+    Checks a parent array and finds every node's root and depth.
+
+    parent : sequence of ints; parent[i] is i's parent, and a negative
+             value or i itself marks a root
+
+    Both come from pointer jumping: each round, every node moves its
+    ancestor pointer to its ancestor's ancestor and adds up the
+    distance, so O(log depth) rounds of NumPy indexing.
+
+    Returns:
+    parent (int64, -1 for roots), root of each node, depth of each node
+    """
+    parent = np.asarray(parent, dtype=np.int64)
+    n = len(parent)
+    if n and parent.max() >= n:
+        raise ValueError("parent ids must be below the number of nodes")
+    ids = np.arange(n)
+    is_root = (parent < 0) | (parent == ids)
+    parent = np.where(is_root, -1, parent)
+
+    ancestor = np.where(is_root, ids, parent)
+    depth = (~is_root).astype(np.int64)
+    for _ in range(n.bit_length() + 1):
+        next_ancestor = ancestor[ancestor]
+        if np.array_equal(next_ancestor, ancestor):
+            # A cycle can also settle on itself, not on a root
+            if not is_root[ancestor].all():
+                break
+            return parent, ancestor, depth
+        depth += depth[ancestor]
+        ancestor = next_ancestor
+    raise ValueError("parent array contains a cycle")
+
+
+def _solve_forest_chunk(ids, parent, depth):
+    """
+    Greedy on whole components, given deepest node first.
+
+    ids    : global node ids
+    parent : parent positions within this chunk (-1 for roots)
+    depth  : node depths (non-increasing)
+
+    Like min_service_centers_array, children's reports are OR-ed into
+    a bytearray with a spare last slot that roots write to; wide levels
+    use NumPy, runs of narrow levels a plain loop.
+
+    Returns:
+    global ids of the nodes that get a service center
+    """
+    k = len(ids)
+    acc = bytearray(k + 1)
+    view = np.frombuffer(acc, dtype=np.uint8)
+    table = np.frombuffer(_REPORT, dtype=np.uint8)
+    bounds = [0, *(np.flatnonzero(np.diff(depth)) + 1).tolist(), k]
+
+    level = 0
+    while level < len(bounds) - 1:
+        lo, hi = bounds[level], bounds[level + 1]
+        level += 1
+        if hi - lo >= VECTOR_LEVEL_MIN:
+            np.bitwise_or.at(view, parent[lo:hi], table[view[lo:hi]])
+            continue
+
+        # Merge this and the narrow levels above it into one range
+        while (level < len(bounds) - 1
+               and bounds[level + 1] - bounds[level] < VECTOR_LEVEL_MIN):
+            level += 1
+        hi = bounds[level]
+        for i, up in zip(range(lo, hi), memoryview(parent[lo:hi])):
+            acc[up] |= _REPORT[acc[i]]
+
+    # A child needs cover, or an uncovered root
+    children = view[:k]
+    centers = ((children & NEEDS_COVER) != 0) | (
+        (parent < 0) & (table[children] == NEEDS_COVER)
+    )
+    return ids[centers]
+
+
+def min_service_centers_forest(parent, workers=1, chunk_nodes=None):
+    """
+    Minimum service centers for a forest of general (n-ary) trees.
+
+    Components (trees) are independent, so they are packed into chunks
+    of whole components and solved across a process pool.
+
+    Parameters:
+    parent      : parent array (see forest_structure)
+    workers     : processes (1 = in this process, None = CPU count)
+    chunk_nodes : nodes per task (default: enough for ~4 tasks per
+                  worker, at least FOREST_CHUNK_MIN)
+
+    Returns:
+    total centers, {root id: sorted center ids of that component}
+    """
+    parent, roots, depth = forest_structure(parent)
+    n = len(parent)
+    if n == 0:
+        return 0, {}
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Component starts, with nodes grouped by root
+    by_root = np.argsort(roots, kind="stable")
+    grouped = roots[by_root]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+
+    # Chunks end at the first component start after each multiple of
+    # chunk_nodes
+    if chunk_nodes is None:
+        chunk_nodes = max(FOREST_CHUNK_MIN, -(-n // (4 * workers)))
+    first = np.searchsorted(starts, np.arange(0, n, chunk_nodes))
+    cuts = np.unique(starts[first[first < len(starts)]]).tolist() + [n]
+    chunk_of = np.empty(n, dtype=np.int64)
+    chunk_of[by_root] = np.searchsorted(cuts, np.arange(n), "right") - 1
+
+    # Each chunk deepest node first, parents as positions in the chunk
+    order = np.lexsort((-depth, chunk_of))
+    position = np.empty(n, dtype=np.int64)
+    position[order] = np.arange(n)
+    up = parent[order]
+    up = np.where(up >= 0, position[up], -1)
+    tasks = []
+    for lo, hi in zip(cuts, cuts[1:]):
+        local = up[lo:hi]
+        tasks.append((order[lo:hi], np.where(local >= 0, local - lo, -1),
+                      depth[order[lo:hi]]))
+
+    if workers == 1 or len(tasks) == 1:
+        solved = [_solve_forest_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            solved = list(executor.map(_solve_forest_chunk, *zip(*tasks)))
+
+    centers = np.concatenate(solved)
+    centers = centers[np.lexsort((centers, roots[centers]))]
+    owner = roots[centers]
+    split = np.flatnonzero(owner[1:] != owner[:-1]) + 1
+    components = dict(zip(owner[np.r_[0, split]].tolist(),
+                          np.split(centers, split)))
+    return len(centers), components
+
+
+# -----------------------------
+# DYNAMIC TREE (INCREMENTAL UPDATES)
+# -----------------------------
+# Report -> DFS state of Solution.minServiceCenters
+_STATE = {NEEDS_COVER: 0, COVERED: 1, HAS_CENTER: 2}
+
+
+class DynamicServiceCenters:
+    """
+    Keeps the greedy service-center solution current while the tree
+    changes.
+
+    Every node caches its report (see _REPORT), which depends only on
+    its children's reports. After a change below a node, only the path
+    from that node to the root is re-evaluated, and the walk stops at
+    the first node whose report did not change: O(depth) per update.
+
+    Nodes are integer ids (the root of the initial tree is 0, then level
+    order); ids of removed nodes are reused. Storage is array('i') for
+    left / right / parent (-1 = none) and a bytearray of reports.
+    """
+
+    def __init__(self, root=None):
+        self.root = -1
+        self.left = array("i")
+        self.right = array("i")
+        self.parent = array("i")
+        self.val = []
+        self._report = bytearray()
+        self._alive = bytearray()
+        self._free = []
+        self._center_ids = set()
+        if root is not None:
+            self.attach(None, None, root)
+
+    # ---- queries ----
+    @property
+    def centers(self):
+        """Minimum number of service centers for the current tree (O(1))."""
+        return len(self._center_ids) + self._root_uncovered()
+
+    def placement(self):
+        """Ids of the nodes that hold a service center."""
+        placed = set(self._center_ids)
+        if self._root_uncovered():
+            placed.add(self.root)       # uncovered root takes a center
+        return placed
+
+    def state(self, node):
+        """
+        Cached DFS state of a node: 0 needs coverage, 1 covered,
+        2 has a service center (before the final root check).
+        """
+        self._check(node)
+        return _STATE[self._report[node]]
+
+    def __len__(self):
+        return len(self._alive) - len(self._free)
+
+    # ---- updates ----
+    def attach(self, parent, side, subtree):
+        """
+        Attaches a TreeNode subtree as the `side` ('left' or 'right')
+        child of node `parent`, or as the whole tree when parent is
+        None. The new nodes are evaluated bottom-up (O(subtree size)),
+        then the path from parent to the root.
+
+        Returns:
+        id of the subtree's root
+        """
+        if parent is None:
+            if self.root >= 0:
+                raise ValueError("the tree already has a root")
+        else:
+            self._check(parent)
+            if side not in ("left", "right"):
+                raise ValueError("side must be 'left' or 'right'")
+            links = self.left if side == "left" else self.right
+            if links[parent] >= 0:
+                raise ValueError(f"node {parent} already has a {side} "
+                                 f"child")
+
+        # Level order, so children get evaluated before their parents
+        nodes = [subtree]
+        for node in nodes:
+            if node.left:
+                nodes.append(node.left)
+            if node.right:
+                nodes.append(node.right)
+        ids = {id(node): self._allocate(node.val) for node in nodes}
+
+        for node in reversed(nodes):
+            i = ids[id(node)]
+            for child, child_links in ((node.left, self.left),
+                                       (node.right, self.right)):
+                if child:
+                    child_links[i] = ids[id(child)]
+                    self.parent[ids[id(child)]] = i
+            self._report[i] = self._evaluate(i)
+            if self._report[i] == HAS_CENTER:
+                self._center_ids.add(i)
+
+        top = ids[id(subtree)]
+        if parent is None:
+            self.root = top
+        else:
+            links[parent] = top
+            self.parent[top] = parent
+            self._refresh(parent)
+        return top
+
+    def detach(self, node):
+        """
+        Removes the subtree rooted at `node` and returns it as a
+        TreeNode tree (e.g. to attach it elsewhere). Costs O(subtree
+        size) to free the ids, plus the path update above it.
+        """
+        self._check(node)
+        above = self.parent[node]
+        if above < 0:
+            self.root = -1
+        elif self.left[above] == node:
+            self.left[above] = -1
+        else:
+            self.right[above] = -1
+
+        copy, ids = self._copy(node)
+        for i in ids:
+            self._release(i)
+
+        if above >= 0:
+            self._refresh(above)
+        return copy
+
+    def remove_leaf(self, node):
+        """Removes a node without children."""
+        self._check(node)
+        if self.left[node] >= 0 or self.right[node] >= 0:
+            raise ValueError(f"node {node} is not a leaf")
+        self.detach(node)
+
+    def to_tree(self):
+        """The current tree as TreeNode objects (None if empty)."""
+        if self.root < 0:
+            return None
+        return self._copy(self.root)[0]
+
+    # ---- internals ----
+    def _root_uncovered(self):
+        return self.root >= 0 and self._report[self.root] == NEEDS_COVER
+
+    def _copy(self, node):
+        """TreeNode copy of the subtree at node, plus the ids it spans."""
+        copy = TreeNode(self.val[node])
+        stack = [(node, copy)]
+        ids = []
+        while stack:
+            i, copied = stack.pop()
+            ids.append(i)
+            for links, side in ((self.left, "left"), (self.right, "right")):
+                child = links[i]
+                if child >= 0:
+                    setattr(copied, side, TreeNode(self.val[child]))
+                    stack.append((child, getattr(copied, side)))
+        return copy, ids
+
+    def _evaluate(self, i):
+        children = 0
+        if self.left[i] >= 0:
+            children |= self._report[self.left[i]]
+        if self.right[i] >= 0:
+            children |= self._report[self.right[i]]
+        return _REPORT[children]
+
+    def _refresh(self, node):
+        """Re-evaluates node and its ancestors until a report holds."""
+        while node >= 0:
+            report = self._evaluate(node)
+            previous = self._report[node]
+            if report == previous:
+                return
+            if previous == HAS_CENTER:
+                self._center_ids.discard(node)
+            if report == HAS_CENTER:
+                self._center_ids.add(node)
+            self._report[node] = report
+            node = self.parent[node]
+
+    def _allocate(self, val):
+        if self._free:
+            i = self._free.pop()
+            self.val[i] = val
+        else:
+            i = len(self._alive)
+            for links in (self.left, self.right, self.parent):
+                links.append(-1)
+            self.val.append(val)
+            self._report.append(0)
+            self._alive.append(0)
+        self._alive[i] = 1
+        return i
+
+    def _release(self, i):
+        self._center_ids.discard(i)
+        self.left[i] = self.right[i] = self.parent[i] = -1
+        self.val[i] = None
+        self._report[i] = 0
+        self._alive[i] = 0
+        self._free.append(i)
+
+    def _check(self, node):
+        if not (0 <= node < len(self._alive) and self._alive[node]):
+            raise ValueError(f"no node {node}")
+
+
+# -----------------------------
+# BENCHMARK TREES
+# -----------------------------
+def make_tree(n, shape="balanced", rng=None):
+    """
+    Builds an n-node tree without recursion.
+
+    shape:
+    - 'balanced' : complete binary tree (level order)
+    - 'skewed'   : a chain of left children, n deep
+    - 'random'   : every new node takes a uniformly random free child
+                   slot of the tree built so far
+    """
+    if n == 0:
+        return None
+    root = TreeNode(0)
+    if shape == "balanced":
+        nodes = [root]
+        for i in range(1, n):
+            node = TreeNode(0)
+            parent = nodes[(i - 1) // 2]
+            if i % 2:
+                parent.left = node
+            else:
+                parent.right = node
+            nodes.append(node)
+    elif shape == "skewed":
+        node = root
+        for _ in range(n - 1):
+            node.left = TreeNode(0)
+            node = node.left
+    elif shape == "random":
+        rng = rng or random.Random()
+        slots = [(root, "left"), (root, "right")]
+        for _ in range(n - 1):
+            j = rng.randrange(len(slots))
+            slots[j], slots[-1] = slots[-1], slots[j]
+            parent, side = slots.pop()
+            node = TreeNode(0)
+            setattr(parent, side, node)
+            slots.append((node, "left"))
+            slots.append((node, "right"))
+    else:
+        raise ValueError(f"unknown shape {shape!r}")
+    return root
+
+
+def to_level_order(root):
+    """
+    Level-order list of a tree (None for missing children, trailing
+    Nones dropped), the input format of build_tree.
+    """
+    values = []
+    queue = [root] if root is not None else []
+    for node in queue:          # the list grows while it is walked
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.val)
+        queue.append(node.left)
+        queue.append(node.right)
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def benchmark_service_centers(n=100_000, shapes=("balanced", "skewed",
+                                                 "random"), seed=0):
+    """
+    Times, on each tree shape:
+    - build_tree and ArrayTree.from_level_order on the level-order list
+    - the recursive Solution (None where it hits the recursion limit),
+      min_service_centers and min_service_centers_array
+
+    Returns:
+    list of {"shape", "n", "centers", "build_s", "array_build_s",
+    "recursive_s", "iterative_s", "array_s"}
+    """
+    def timed(function, *args):
+        started = time.perf_counter()
+        result = function(*args)
+        return result, time.perf_counter() - started
+
+    records = []
+    for shape in shapes:
+        values = to_level_order(make_tree(n, shape, random.Random(seed)))
+
+        root, build = timed(build_tree, values)
+        centers, iterative = timed(min_service_centers, root)
+        recursive = None
+        try:
+            expected, recursive = timed(Solution().minServiceCenters, root)
+        except RecursionError:
+            expected = centers
+        root = None
+
+        tree, array_build = timed(ArrayTree.from_level_order, values)
+        array_centers, array = timed(min_service_centers_array, tree)
+        if not expected == centers == array_centers:
+            raise AssertionError(
+                f"{shape}: {expected}, {centers}, {array_centers}"
+            )
+
+        records.append({
+            "shape": shape,
+            "n": n,
+            "centers": centers,
+            "build_s": build,
+            "array_build_s": array_build,
+            "recursive_s": recursive,
+            "iterative_s": iterative,
+            "array_s": array,
+        })
+    return records
+
+
+# -----------------------------
+# TEST CASE (FROM QUESTION)
+# -----------------------------
+def run_example():
+    """Runs the test case from the question."""
+
+    # Input (level-order):
+    # {0, 0, null, 0, null, 0, null, null, 0}
+    tree_input = [0, 0, None, 0, None, 0, None, None, 0]
+
+    root = build_tree(tree_input)
+
+    solution = Solution()
+    print(
+        "Minimum service centers required:",
+        solution.minServiceCenters(root)
+    )
+
+
+# -----------------------------
+# COMMAND LINE
+# -----------------------------
+def main(argv=None):
+    """
+    Solves the tree given in level order on the command line ('null'
+    marks a missing child), or runs the test case when none is given.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Minimum service centers on a binary tree."
+    )
+    parser.add_argument("nodes", nargs="*",
+                        help="level-order values, e.g. 0 0 null 0")
+    parser.add_argument("--benchmark", type=int, default=None,
+                        metavar="N",
+                        help="time both solvers on N-node balanced, "
+                             "skewed and random trees")
+    parser.add_argument("--file", default=None,
+                        help="read the level order from this file "
+                             "(streamed, never loaded whole)")
+    parser.add_argument("--binary", action="store_true",
+                        help="--file holds int32 values, not text")
+    parser.add_argument("--null", default=None,
+                        help="missing-node marker in --file (default: "
+                             "'null' for text, -1 for binary)")
+    parser.add_argument("--parents", nargs="+", type=int, default=None,
+                        metavar="P",
+                        help="solve a forest of general trees given as a "
+                             "parent array (-1 marks a root)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes for --parents (0 = CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.parents:
+        total, components = min_service_centers_forest(
+            args.parents, workers=args.workers or None
+        )
+        for root, centers in components.items():
+            print(f"Tree rooted at {root}: centers at {centers.tolist()}")
+        print("Minimum service centers required:", total)
+        return
+    if args.file:
+        if args.binary:
+            tokens = read_level_order(
+                args.file, binary=True,
+                null=-1 if args.null is None else int(args.null),
+            )
+        else:
+            tokens = read_level_order(args.file, null=args.null or "null")
+        tree = ArrayTree.from_stream(tokens)
+        print(f"Nodes: {len(tree)}")
+        print(
+            "Minimum service centers required:",
+            min_service_centers_array(tree)
+        )
+        return
+
+    if args.benchmark:
+        for record in benchmark_service_centers(args.benchmark):
+            recursive = record["recursive_s"]
+            recursive = ("RecursionError" if recursive is None
+                         else f"{recursive:.3f}s")
+            print(f"{record['shape']:>8}: {record['centers']} centers | "
+                  f"build: nodes {record['build_s']:.3f}s, "
+                  f"arrays {record['array_build_s']:.3f}s | "
+                  f"solve: recursive {recursive}, "
+                  f"iterative {record['iterative_s']:.3f}s, "
+                  f"arrays {record['array_s']:.3f}s")
+        return
+    if not args.nodes:
+        run_example()
+        return
+    tree_input = [
+        None if token.lower() in ("null", "none") else int(token)
+        for token in args.nodes
+    ]
+    print(
+        "Minimum service centers required:",
+        min_service_centers(build_tree(tree_input))
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,3 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 from collections import deque
 import heapq
 import math
@@ -148,39 +146,63 @@ def a_star_search(graph, start, goal):
     return edges, [], float("inf")
 
 # =====================================================
-# RUN SEARCHES
+# VISUALIZATION: STATE SPACE
 # =====================================================
-dfs_edges, dfs_path, dfs_cost = dfs_search(GRAPH, START, GOAL)
-bfs_edges, bfs_path, bfs_cost = bfs_search(GRAPH, START, GOAL)
-astar_edges, astar_path, astar_cost = a_star_search(GRAPH, START, GOAL)
-
-print("\nDFS Path :", " -> ".join(dfs_path), "| Cost:", dfs_cost)
-print("BFS Path :", " -> ".join(bfs_path), "| Cost:", bfs_cost)
-print("A*  Path :", " -> ".join(astar_path), "| Cost:", astar_cost)
+def plot_state_space(graph=GRAPH, pos=POS, start=START, goal=GOAL):
+    # networkx and matplotlib are only needed for the plot
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = nx.Graph()
+    for u in graph:
+        for v, w in graph[u].items():
+            G.add_edge(u, v, weight=w)
+
+    plt.figure(figsize=(12, 8))
+    nx.draw(
+        G, pos, with_labels=True,
+        node_color=[
+            "skyblue" if n == start else
+            "red" if n == goal else
+            "lightgray" for n in G.nodes()
+        ],
+        node_size=1600,
+        edgecolors="black"
+    )
+    nx.draw_networkx_edge_labels(
+        G, pos,
+        edge_labels={(u, v): d["weight"] for u, v, d in G.edges(data=True)}
+    )
+    plt.title("State Space Graph (Poland Map)", fontweight="bold")
+    plt.axis("off")
+    plt.show()
 
 # =====================================================
-# VISUALIZATION: STATE SPACE
+# RUN SEARCHES
 # =====================================================
-G = nx.Graph()
-for u in GRAPH:
-    for v, w in GRAPH[u].items():
-        G.add_edge(u, v, weight=w)
-
-plt.figure(figsize=(12, 8))
-nx.draw(
-    G, POS, with_labels=True,
-    node_color=[
-        "skyblue" if n == START else
-        "red" if n == GOAL else
-        "lightgray" for n in G.nodes()
-    ],
-    node_size=1600,
-    edgecolors="black"
-)
-nx.draw_networkx_edge_labels(
-    G, POS,
-    edge_labels={(u, v): d["weight"] for u, v, d in G.edges(data=True)}
-)
-plt.title("State Space Graph (Poland Map)", fontweight="bold")
-plt.axis("off")
-plt.show()
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="DFS, BFS and A* search on the Poland map."
+    )
+    parser.add_argument("--start", default=START, choices=sorted(GRAPH))
+    parser.add_argument("--goal", default=GOAL, choices=sorted(GRAPH))
+    parser.add_argument("--no-plot", action="store_true",
+                        help="skip the state space plot")
+    args = parser.parse_args(argv)
+
+    dfs_edges, dfs_path, dfs_cost = dfs_search(GRAPH, args.start, args.goal)
+    bfs_edges, bfs_path, bfs_cost = bfs_search(GRAPH, args.start, args.goal)
+    astar_edges, astar_path, astar_cost = a_star_search(GRAPH, args.start, args.goal)
+
+    print("\nDFS Path :", " -> ".join(dfs_path), "| Cost:", dfs_cost)
+    print("BFS Path :", " -> ".join(bfs_path), "| Cost:", bfs_cost)
+    print("A*  Path :", " -> ".join(astar_path), "| Cost:", astar_cost)
+
+    if not args.no_plot:
+        plot_state_space(GRAPH, POS, args.start, args.goal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import numpy as np
+
+from q1a_sensor_hub import StreamingGeometricMedian, geometric_median_batch
+
+
+def test_streaming_hub_leaves_a_sensor_it_settled_on():
+    stream = StreamingGeometricMedian()
+    assert stream.update([(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]) == (0, 0)
+    assert stream.update([(100, 100)] * 50) == (100.0, 100.0)
+
+
+def test_warm_start_on_a_non_optimal_sensor_keeps_iterating():
+    rng = np.random.default_rng(0)
+    points = rng.random((50, 2))
+    points[0] = 0
+    warm, iterations = geometric_median_batch(points, start=[(0, 0)])
+    cold, _ = geometric_median_batch(points)
+    assert iterations[0] > 1
+    np.testing.assert_allclose(warm[0], cold[0], atol=1e-4)
+
+
+def test_expire_drops_old_sensors_across_the_ring_wrap():
+    stream = StreamingGeometricMedian(window=8, max_age=10)
+    for now in range(0, 60, 5):
+        stream.update([(now, 0)], now=now)
+        expected = [t for t in range(0, now + 1, 5) if t >= now - 10][-8:]
+        assert stream.points()[:, 0].tolist() == expected
+
+
+def test_expire_with_every_sensor_stale():
+    stream = StreamingGeometricMedian(window=4, max_age=1)
+    stream.update([(1, 1)] * 6, now=0)
+    assert stream.expire(5) == 4
+    assert len(stream) == 0
+
+
+def test_sampled_k_median_scores_every_sensor():
+    from q1a_sensor_hub import assign_to_hubs, k_median, k_median_placement
+
+    rng = np.random.default_rng(3)
+    centers = rng.random((6, 2)) * 100
+    points = centers[rng.integers(6, size=5000)] + rng.normal(0, 1, (5000, 2))
+
+    hubs, labels, cost = k_median(points, 6, np.random.default_rng(0),
+                                  sample_size=500)
+    dist, expected = assign_to_hubs(points, hubs)
+    assert np.array_equal(labels, expected)
+    assert np.isclose(cost, dist.sum())
+
+    hubs, labels, cost = k_median_placement(points, 6, restarts=3,
+                                            workers=1, seed=0,
+                                            sample_size=500)
+    assert len(labels) == len(points)
+    # Every true cluster ends up with a hub next to it
+    assert np.linalg.norm(centers[:, None] - hubs[None], axis=2).min(
+        axis=1).max() < 2
+
+
+def test_squarem_reaches_the_plain_optimum_in_fewer_steps():
+    from q1a_sensor_hub import elongated_cluster, geometric_median_accelerated
+
+    points = elongated_cluster(2000, aspect=300, rng=np.random.default_rng(1))
+    plain_hub, plain = geometric_median_accelerated(
+        points, max_iter=100_000, accelerate=False)
+    hub, fast = geometric_median_accelerated(points, max_iter=100_000)
+    assert fast["stop_reason"] in ("converged", "optimal")
+    assert fast["iterations"] < plain["iterations"] / 2
+    assert fast["objective"] <= plain["objective"] + 1e-6
+    np.testing.assert_allclose(hub, plain_hub, atol=1e-3)
+
+
+def test_squarem_stops_on_an_optimal_sensor():
+    from q1a_sensor_hub import geometric_median_accelerated
+
+    points = [(0, 0)] * 5 + [(1, 0), (-1, 0), (0, 3)]
+    hub, stats = geometric_median_accelerated(points)
+    assert stats["stop_reason"] == "optimal"
+    np.testing.assert_allclose(hub, (0, 0), atol=1e-6)
@@ -0,0 +1,87 @@
+import os
+import random
+from array import array
+
+import pytest
+
+from q1b_tsp_sa import apply_two_opt
+
+
+def _cycle(tour):
+    """Tour as a direction- and rotation-free set of edges."""
+    return {frozenset(edge) for edge in zip(tour, tour[1:] + tour[:1])}
+
+
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_apply_two_opt_keeps_positions_in_sync(n):
+    rng = random.Random(n)
+    tour = array("i", range(n))
+    rng.shuffle(tour)
+    pos = array("i", bytes(4 * n))
+    for p, city in enumerate(tour):
+        pos[city] = p
+
+    for _ in range(200):
+        i, j = sorted(rng.sample(range(n + 1), 2))
+        expected = list(tour[:i]) + list(tour[i:j])[::-1] + list(tour[j:])
+        apply_two_opt(tour, i, j, pos)
+        assert _cycle(list(tour)) == _cycle(expected)
+        assert all(tour[pos[city]] == city for city in range(n))
+
+
+def test_parallel_tempering_raises_when_a_worker_dies(monkeypatch):
+    import multiprocessing
+
+    import q1b_tsp_sa
+
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("the patched worker is only inherited through fork")
+
+    def crash(self, request):
+        if request[0] == "run":
+            os._exit(1)
+        return original(self, request)
+
+    original = q1b_tsp_sa._ReplicaHost.handle
+    monkeypatch.setattr(q1b_tsp_sa._ReplicaHost, "handle", crash)
+    cities = q1b_tsp_sa.generate_cities(20, rng=random.Random(0))
+    with pytest.raises(RuntimeError, match="worker died"):
+        q1b_tsp_sa.parallel_tempering(cities, replicas=4, workers=2,
+                                      rounds=3, steps_per_round=10)
+
+
+def test_polish_tour_stops_at_a_local_optimum():
+    from q1b_tsp_sa import generate_cities, polish_tour
+
+    cities = generate_cities(1000, rng=random.Random(1))
+    tour = list(range(1000))
+    random.Random(2).shuffle(tour)
+    tour, length = polish_tour(tour, cities)
+    again, second = polish_tour(tour, cities)
+    assert second == length
+    assert list(again) == list(tour)
+
+
+@pytest.mark.parametrize("neighbors", [None, 3])
+def test_frozen_chain_accepts_nothing(neighbors):
+    import math
+
+    from q1b_tsp_sa import AnnealingChain, build_candidate_lists
+
+    # Cities on a circle, toured in order: every real move is uphill
+    n = 8
+    cities = [(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n))
+              for k in range(n)]
+    candidates = (None if neighbors is None
+                  else build_candidate_lists(cities, neighbors))
+    chain = AnnealingChain(cities, rng=random.Random(0),
+                           candidates=candidates)
+    chain.tour = array("i", range(n))
+    if chain.pos is not None:
+        chain.pos = array("i", range(n))
+    chain.current_distance = chain.best_distance = sum(
+        math.dist(cities[k], cities[(k + 1) % n]) for k in range(n))
+
+    chain.run(1e-2, 5000)
+    assert chain.accepted == 0
+    assert list(chain.tour) == list(range(n))
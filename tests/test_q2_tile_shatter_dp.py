@@ -0,0 +1,9 @@
+from q2_tile_shatter_dp import ScoreCache, maxPoints_batch
+
+
+def test_batch_cache_keeps_int_and_float_tiles_apart():
+    cache = ScoreCache()
+    assert maxPoints_batch([[1.0, 2.0]], cache=cache) == [4.0]
+    scores = maxPoints_batch([[1, 2], [1.0, 2.0]], cache=cache)
+    assert scores == [4, 4.0]
+    assert type(scores[0]) is int and type(scores[1]) is float